@@ -12,6 +12,10 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Block-buffer stdout so the per-survey status lines below don't each trigger
+# a write syscall; input() still flushes before the confirmation prompt.
+sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
 from dotenv import load_dotenv
 from qualtrics_sdk import QualtricsAPI
 
@@ -7,5 +7,16 @@ __author__ = "Your Name"
 __license__ = "MIT"
 
 from qualtrics_sdk.core.client import QualtricsAPI
+from qualtrics_sdk.core.exceptions import QualtricsAPIError
+from qualtrics_sdk.core.survey_builder import SurveyBuilder
 
-__all__ = ["QualtricsAPI"]
+__all__ = ["QualtricsAPI", "AsyncQualtricsAPI", "QualtricsAPIError", "SurveyBuilder"]
+
+
+def __getattr__(name):
+    # Import the async client (and httpx) only when it is first used, so
+    # synchronous users don't pay for loading it
+    if name == "AsyncQualtricsAPI":
+        from qualtrics_sdk.core.async_client import AsyncQualtricsAPI
+        return AsyncQualtricsAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,375 @@
+"""
+Async Qualtrics API Client
+Asyncio-based client for high-fanout question creation and display logic
+
+Requires httpx (``pip install qualtrics-sdk[async]``, which also pulls in
+h2 so requests are multiplexed over a single HTTP/2 connection).
+"""
+
+import asyncio
+from typing import Dict, List, Any, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (enables httpx's HTTP/2 support)
+    _HAS_HTTP2 = True
+except ImportError:  # pragma: no cover - exercised only without h2
+    _HAS_HTTP2 = False
+
+from .display_logic import DisplayLogicMixin
+from .embedded_data import _POSITIONS, EmbeddedDataMixin
+from .exceptions import QualtricsAPIError
+from .questions import QuestionMixin
+from ..utils.serialization import dumps
+
+
+class AsyncQualtricsAPI(QuestionMixin, DisplayLogicMixin):
+    """
+    Async Qualtrics client for creating many questions concurrently.
+
+    Reuses every create_* method from QuestionMixin and the display logic
+    methods from DisplayLogicMixin; here they return coroutines, so await
+    them. Validation still happens (and raises) before anything is sent.
+    A single event loop keeps hundreds of requests in flight without a
+    thread per request.
+
+    Usage:
+        >>> async with AsyncQualtricsAPI(api_token="xxx", data_center="yyy.qualtrics.com") as api:
+        ...     await api.create_text_entry_question(survey_id, "Comments?")
+        ...     await api.create_questions_bulk(survey_id, specs)
+        ...     await api.add_display_logic_batch(survey_id, rules)
+        ...     await api.set_embedded_data_fields_bulk({sid: fields for sid in survey_ids})
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        data_center: str,
+        max_connections: int = 100,
+        http2: Optional[bool] = None,
+    ):
+        """
+        Initialize the async Qualtrics API client.
+
+        Args:
+            api_token: Your Qualtrics API token
+            data_center: Your data center (e.g., 'upenn.qualtrics.com')
+            max_connections: Upper bound on open connections (default: 100)
+            http2: Multiplex requests over HTTP/2. Defaults to on when the
+                   h2 package is installed, otherwise HTTP/1.1.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncQualtricsAPI requires httpx. "
+                "Install it with: pip install qualtrics-sdk[async]"
+            )
+
+        self.api_token = api_token
+        self.data_center = data_center
+        self.base_url = f'https://{data_center}/API/v3'
+        self.headers = {
+            'X-API-TOKEN': api_token,
+            'Content-Type': 'application/json'
+        }
+        if http2 is None:
+            http2 = _HAS_HTTP2
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections // 2,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        op: str,
+        parse_result: bool = True,
+        json: Any = None,
+        **kwargs
+    ) -> Any:
+        """
+        Send a request to the API and check its status.
+
+        Async counterpart of APIBase._request; see there for the argument
+        semantics.
+        """
+        if json is not None:
+            kwargs["content"] = dumps(json)
+        response = await self._client.request(method, path, **kwargs)
+
+        if response.status_code != 200:
+            raise QualtricsAPIError(op, response)
+
+        if parse_result:
+            return response.json()["result"]
+        return True
+
+    async def _send_question(
+        self,
+        survey_id: str,
+        question_data: Dict[str, Any],
+        question_id: Optional[str] = None,
+        block_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a new question or replace an existing one in place.
+
+        Async counterpart of QuestionMixin._send_question; see there for
+        the argument semantics.
+        """
+        if question_id:
+            # PUT returns no result key — just confirm success
+            await self._request(
+                "PUT", f"/survey-definitions/{survey_id}/questions/{question_id}",
+                json=question_data, op="update question", parse_result=False
+            )
+            return {"QuestionID": question_id}
+
+        params = {"blockId": block_id} if block_id else None
+        return await self._request(
+            "POST", f"/survey-definitions/{survey_id}/questions",
+            json=question_data, params=params, op="create question"
+        )
+
+    async def get_question(self, survey_id: str, question_id: str) -> Dict[str, Any]:
+        """
+        Get a question's definition.
+
+        Args:
+            survey_id: The survey ID
+            question_id: The question ID
+
+        Returns:
+            Dictionary with the question definition
+        """
+        return await self._request(
+            "GET", f"/survey-definitions/{survey_id}/questions/{question_id}",
+            op="get question"
+        )
+
+    async def get_display_logic(
+        self, survey_id: str, question_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Async counterpart of DisplayLogicMixin.get_display_logic."""
+        self._validate_question_refs(question_id)
+        question = await self.get_question(survey_id, question_id)
+        return question.get('DisplayLogic')
+
+    async def _put_question_with_display_logic(
+        self,
+        survey_id: str,
+        question_id: str,
+        display_logic: Optional[Dict[str, Any]],
+        op: str
+    ) -> bool:
+        """
+        Replace a question's display logic (GET, rebuild payload, PUT).
+
+        Async counterpart of DisplayLogicMixin._put_question_with_display_logic.
+        """
+        current_question = await self.get_question(survey_id, question_id)
+        if current_question.get('DisplayLogic') == display_logic:
+            return True
+        question_data = self._build_question_update_payload(
+            current_question, question_id, display_logic
+        )
+        return await self._request(
+            "PUT", f"/survey-definitions/{survey_id}/questions/{question_id}",
+            json=question_data, op=op, parse_result=False
+        )
+
+    async def add_display_logic_batch(
+        self,
+        survey_id: str,
+        rules: List[Dict[str, Any]],
+        max_concurrency: int = 16,
+    ) -> List[Dict[str, Any]]:
+        """
+        Add display logic to many questions concurrently.
+
+        Same rule format and per-rule results as
+        DisplayLogicMixin.add_display_logic_batch, but each rule's GET and
+        PUT run on the event loop with at most max_concurrency rules in
+        flight.
+
+        Args:
+            survey_id: The survey ID
+            rules: List of rule dictionaries, each with a question_id
+            max_concurrency: Maximum number of rules in flight (default: 16)
+
+        Returns:
+            One dictionary per rule, in input order, with question_id,
+            success (bool) and error (the exception, or None)
+        """
+        question_ids = [rule['question_id'] for rule in rules]
+        if len(set(question_ids)) != len(question_ids):
+            raise ValueError(
+                "Each question may appear in only one rule; "
+                "combine its conditions with 'conditions' instead"
+            )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def apply(rule):
+            kwargs = dict(rule)
+            question_id = kwargs.pop('question_id')
+            if 'conditions' in kwargs:
+                add = self.add_display_logic_multiple
+            else:
+                add = self.add_display_logic
+            async with semaphore:
+                try:
+                    await add(survey_id, question_id, **kwargs)
+                except Exception as error:
+                    return {'question_id': question_id, 'success': False, 'error': error}
+            return {'question_id': question_id, 'success': True, 'error': None}
+
+        return list(await asyncio.gather(*(apply(rule) for rule in rules)))
+
+    async def create_questions_bulk(
+        self, survey_id: str,
+        specs: List[Dict[str, Any]],
+        max_concurrency: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many questions concurrently.
+
+        Same spec format and ordering caveat as
+        QuestionMixin.create_questions_bulk, but runs on the event loop with
+        at most max_concurrency requests in flight.
+
+        Args:
+            survey_id: The survey ID
+            specs: List of question specs (see QUESTION_CREATORS)
+            max_concurrency: Maximum number of in-flight requests (default: 50)
+
+        Returns:
+            List of question details, in the same order as specs
+        """
+        calls = self._resolve_question_specs(specs)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(create, kwargs):
+            async with semaphore:
+                return await create(survey_id, **kwargs)
+
+        return list(await asyncio.gather(*(run(c, kw) for c, kw in calls)))
+
+    async def get_survey_flow(self, survey_id: str) -> Dict[str, Any]:
+        """Async counterpart of EmbeddedDataMixin.get_survey_flow (uncached)."""
+        return await self._request(
+            "GET", f"/survey-definitions/{survey_id}/flow", op="get survey flow"
+        )
+
+    async def _put_survey_flow(
+        self,
+        survey_id: str,
+        flow: Dict[str, Any],
+        op: str,
+        changed_element: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Async counterpart of EmbeddedDataMixin._put_survey_flow (no cache)."""
+        path = f"/survey-definitions/{survey_id}/flow"
+        if changed_element is not None and changed_element.get("FlowID"):
+            try:
+                await self._request(
+                    "PUT", f"{path}/{changed_element['FlowID']}",
+                    json=changed_element, op=op, parse_result=False
+                )
+                return
+            except QualtricsAPIError:
+                pass  # fall back to replacing the whole flow
+        await self._request("PUT", path, json=flow, op=op, parse_result=False)
+
+    async def get_embedded_data(self, survey_id: str) -> List[Dict[str, Any]]:
+        """Async counterpart of EmbeddedDataMixin.get_embedded_data."""
+        return EmbeddedDataMixin._embedded_data_in_flow(await self.get_survey_flow(survey_id))
+
+    async def set_embedded_data_fields(
+        self,
+        survey_id: str,
+        fields: Dict[str, Dict[str, Any]],
+        position: str = "start",
+    ) -> Dict[str, Any]:
+        """
+        Configure multiple embedded data fields in one flow update.
+
+        Async counterpart of EmbeddedDataMixin.set_embedded_data_fields; see
+        there for the field format.
+        """
+        if position not in _POSITIONS:
+            raise ValueError("position must be 'start' or 'end'")
+        items = EmbeddedDataMixin._embedded_data_items(fields)
+
+        current_flow = await self.get_survey_flow(survey_id)
+        update_payload, changed_element = EmbeddedDataMixin._flow_with_embedded_data(
+            current_flow, items, position
+        )
+        await self._put_survey_flow(
+            survey_id, update_payload, op="set embedded data fields",
+            changed_element=changed_element
+        )
+
+        return {
+            "fields": list(fields.keys()),
+            "count": len(fields),
+            "position": position,
+            "success": True
+        }
+
+    async def set_embedded_data_fields_bulk(
+        self,
+        survey_fields: Dict[str, Dict[str, Dict[str, Any]]],
+        position: str = "start",
+        max_concurrency: int = 16,
+    ) -> List[Dict[str, Any]]:
+        """
+        Configure embedded data fields on many surveys concurrently.
+
+        Each survey costs one GET and one PUT of its flow; up to
+        max_concurrency surveys are updated at a time. A failing survey is
+        reported in the results rather than raised.
+
+        Args:
+            survey_fields: Mapping of survey ID to its fields (same format as
+                           set_embedded_data_fields)
+            position: Where to place the fields in each flow - "start" or "end"
+            max_concurrency: Maximum number of surveys in flight (default: 16)
+
+        Returns:
+            One dictionary per survey, in input order, with survey_id,
+            success (bool) and error (the exception, or None)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def apply(survey_id, fields):
+            async with semaphore:
+                try:
+                    await self.set_embedded_data_fields(survey_id, fields, position)
+                except Exception as error:
+                    return {'survey_id': survey_id, 'success': False, 'error': error}
+            return {'survey_id': survey_id, 'success': True, 'error': None}
+
+        return list(await asyncio.gather(
+            *(apply(survey_id, fields) for survey_id, fields in survey_fields.items())
+        ))
@@ -3,8 +3,73 @@ Base API Client
 Core functionality for making requests to the Qualtrics API
 """
 
+import copy
+import re
+import threading
+import time
+from concurrent.futures import Future
+from urllib.parse import urlsplit
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, Tuple
+
+from .exceptions import QualtricsAPIError
+from ..utils.serialization import dumps, loads
+
+
+_SURVEY_ID_IN_URL = re.compile(r'/survey-definitions/([^/?]+)')
+_SURVEY_LIST_URL = re.compile(r'/surveys(\?|$)')
+_QUESTION_PATH = re.compile(r'/survey-definitions/[^/]+/questions/[^/]+$')
+
+
+class _JSONResponse(requests.Response):
+    """Response whose json() decodes with the fast serializer."""
+
+    def json(self, **kwargs):
+        if kwargs:
+            return super().json(**kwargs)
+        return loads(self.content)
+
+
+class _JSONAdapter(HTTPAdapter):
+    """HTTPAdapter that hands back _JSONResponse objects."""
+
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        response.__class__ = _JSONResponse
+        return response
+
+
+class _Retry(Retry):
+    """
+    Retry policy that only retries POSTs on 429.
+
+    A rate-limited POST was never processed, so retrying it is safe; a POST
+    that hit a 5xx, or whose response was lost to a read or protocol error,
+    may already have created the survey or question. Connect timeouts are
+    still retried, since the request never left the client.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method == 'POST' and status_code != 429:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, error=None,
+                  _pool=None, _stacktrace=None):
+        if method == 'POST' and error is not None and not self._is_connection_error(error):
+            raise error.with_traceback(_stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class _JSONSession(requests.Session):
+    """Session that encodes ``json=`` bodies with the fast serializer."""
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get('json') is not None and kwargs.get('data') is None:
+            kwargs['data'] = dumps(kwargs.pop('json'))
+        return super().request(method, url, **kwargs)
 
 
 class APIBase:
@@ -13,20 +78,276 @@ class APIBase:
 
     Handles initialization, authentication, and provides common attributes
     that all mixins can access.
+
+    All requests go through a single ``requests.Session`` so the TCP/TLS
+    connection to the data center is reused between calls. Use the client as
+    a context manager (or call ``close()``) to release pooled connections.
+    Rate-limited (429) and transient 5xx responses are retried with
+    exponential backoff, honoring ``Retry-After``. Responses are requested
+    compressed; brotli and zstd are advertised automatically when their
+    decoders are installed (the ``fast`` extra, which also requires urllib3 2;
+    zstd needs it), otherwise gzip/deflate.
+
+    Read-mostly GETs (survey definitions, flows, blocks, questions) are
+    cached for ``cache_ttl`` seconds and revalidated with ``If-None-Match``
+    when the server sends an ETag. Expired entries are dropped whenever a
+    new one is cached, so the cache only holds recent reads. A write through
+    the session evicts the cached copy of the resource it touched and of
+    every resource that embeds it. Only a survey's questions are kept across
+    writes to that survey (a question write drops the survey definition,
+    flow and blocks, but not the survey's other questions). Threads that
+    miss the cache for the same URL at the same time share one GET.
+
+    Instance state is declared in ``__slots__`` (the mixins declare none), so
+    clients carry no per-instance ``__dict__``. Subclasses that need extra
+    attributes simply omit ``__slots__`` and get a ``__dict__`` back.
     """
 
-    def __init__(self, api_token: str, data_center: str):
+    __slots__ = (
+        'api_token', 'data_center', 'base_url', 'headers',
+        'cache_ttl', '_cache', '_inflight', '_inflight_lock',
+        'session', '__weakref__',
+    )
+
+    def __init__(
+        self,
+        api_token: str,
+        data_center: str,
+        cache_ttl: float = 60.0,
+        max_retries: int = 5,
+    ):
         """
         Initialize the Qualtrics API client.
 
         Args:
             api_token: Your Qualtrics API token
             data_center: Your data center (e.g., 'upenn.qualtrics.com')
+            cache_ttl: Seconds to reuse cached GET results (default: 60).
+                       Set to 0 to disable caching.
+            max_retries: Retries for rate-limited (429) and transient 5xx
+                         responses, with exponential backoff (default: 5)
         """
         self.api_token = api_token
         self.data_center = data_center
         self.base_url = f'https://{data_center}/API/v3'
+        # Kept as a public attribute for backward compatibility; requests
+        # rely on the session's default headers instead of passing these
         self.headers = {
             'X-API-TOKEN': api_token,
             'Content-Type': 'application/json'
         }
+
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Optional[str], Any]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        self.session = _JSONSession()
+        self.session.headers.update(self.headers)
+        retry = _Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'POST', 'PUT', 'DELETE'],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount('https://', _JSONAdapter(
+            pool_connections=10, pool_maxsize=50, max_retries=retry
+        ))
+        self.session.hooks['response'].append(self._invalidate_on_write)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        op: str,
+        parse_result: bool = True,
+        **kwargs
+    ) -> Any:
+        """
+        Send a request to the API and check its status.
+
+        Args:
+            method: HTTP method ('GET', 'POST', 'PUT', 'DELETE')
+            path: Path relative to base_url (e.g. '/survey-definitions')
+            op: Description used in the error message (e.g. "create survey")
+            parse_result: If True, return the body's 'result' value;
+                          otherwise return True
+            **kwargs: Passed through to the session (json, params, files, ...)
+
+        Returns:
+            The response 'result' payload, or True when parse_result is False
+
+        Raises:
+            QualtricsAPIError: If the API returns a non-200 status
+        """
+        response = getattr(self.session, method.lower())(self._url(path), **kwargs)
+
+        if response.status_code != 200:
+            raise QualtricsAPIError(op, response)
+
+        if parse_result:
+            return response.json()['result']
+        return True
+
+    def _url(self, path: str) -> str:
+        """Resolve an API path against base_url; absolute URLs pass through."""
+        if path.startswith('https://'):
+            return path
+        return self.base_url + path
+
+    def _cached_get(self, path: str, op: str) -> Any:
+        """
+        GET a path and return its parsed JSON body, using the response cache.
+
+        Args:
+            path: Path relative to base_url, or an absolute URL such as a
+                  pagination link (the resolved URL is the cache key)
+            op: Description used in the error message (e.g. "get survey")
+
+        Returns:
+            The parsed JSON body (callers get their own copy)
+
+        Raises:
+            QualtricsAPIError: If the API call fails
+        """
+        url = self._url(path)
+        if self.cache_ttl > 0:
+            entry = self._cache.get(url)
+            if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+                return copy.deepcopy(entry[2])
+
+        # Concurrent misses for the same URL wait on the first one's GET
+        with self._inflight_lock:
+            future = self._inflight.get(url)
+            leader = future is None
+            if leader:
+                future = self._inflight[url] = Future()
+        if leader:
+            try:
+                future.set_result(self._fetch(url, op))
+            except BaseException as error:
+                future.set_exception(error)
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[url]
+        return copy.deepcopy(future.result())
+
+    def _fetch(self, url: str, op: str) -> Any:
+        """GET url (revalidating any cached copy) and cache the parsed body."""
+        if self.cache_ttl <= 0:
+            response = self.session.get(url)
+            if response.status_code != 200:
+                raise QualtricsAPIError(op, response)
+            return response.json()
+
+        entry = self._cache.get(url)
+        now = time.monotonic()
+        headers = {'If-None-Match': entry[1]} if entry is not None and entry[1] else None
+        response = self.session.get(url, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            self._cache_put(url, now, entry[1], entry[2])
+            return entry[2]
+        if response.status_code != 200:
+            raise QualtricsAPIError(op, response)
+
+        body = response.json()
+        self._cache_put(url, now, response.headers.get('ETag'), body)
+        return body
+
+    def _cache_put(self, url: str, now: float, etag: Optional[str], body: Any) -> None:
+        """
+        Cache a body under url, first evicting every expired entry.
+
+        Pruning on insert keeps the cache bounded by what was read within the
+        last cache_ttl seconds, however many surveys a long-running client
+        touches.
+        """
+        for key, entry in list(self._cache.items()):
+            if now - entry[0] >= self.cache_ttl:
+                self._cache.pop(key, None)
+        self._cache[url] = (now, etag, body)
+
+    def _store_cached(self, path: str, body: Any) -> None:
+        """
+        Seed the cache with a body the client already knows is current.
+
+        Used after a successful write so the next read of the same resource
+        is served locally instead of re-fetched. The entry has no ETag, so it
+        is re-fetched in full once cache_ttl expires.
+
+        Args:
+            path: Path relative to base_url (same form as for _cached_get)
+            body: The JSON body a GET of path would return
+        """
+        if self.cache_ttl > 0:
+            self._cache_put(self._url(path), time.monotonic(), None, copy.deepcopy(body))
+
+    def _drop_cached(self, path: str) -> None:
+        """Evict one cached resource (same path form as for _cached_get)."""
+        self._cache.pop(self._url(path), None)
+
+    def invalidate_cache(self, survey_id: Optional[str] = None) -> None:
+        """
+        Drop cached GET results.
+
+        Args:
+            survey_id: Only drop entries for this survey (plus the survey
+                       list). If None, clear the whole cache.
+        """
+        if survey_id is None:
+            self._cache.clear()
+            return
+
+        for url in list(self._cache):
+            match = _SURVEY_ID_IN_URL.search(url)
+            if (match and match.group(1) == survey_id) or _SURVEY_LIST_URL.search(url):
+                self._cache.pop(url, None)
+
+    def _invalidate_on_write(self, response: requests.Response, *args, **kwargs) -> None:
+        """
+        Session response hook: evict cached reads made stale by a write.
+
+        Drops the survey list and every cached entry of the written survey
+        except its other questions: the survey definition, flow and blocks
+        all embed block and question membership, which any write may change.
+        A question's own entry is only dropped when it (or an ancestor) is
+        written, or when a DELETE removes it.
+        """
+        request = response.request
+        if request.method == 'GET':
+            return
+        written_match = _SURVEY_ID_IN_URL.search(request.url)
+        if not written_match:
+            self.invalidate_cache()
+            return
+
+        written = urlsplit(request.url).path
+        for url in list(self._cache):
+            if _SURVEY_LIST_URL.search(url):
+                self._cache.pop(url, None)
+                continue
+            match = _SURVEY_ID_IN_URL.search(url)
+            if not match or match.group(1) != written_match.group(1):
+                continue
+            path = urlsplit(url).path
+            if (
+                not _QUESTION_PATH.search(path)
+                or written == path
+                or written.startswith(path + '/')
+                or (request.method == 'DELETE' and path.startswith(written + '/'))
+            ):
+                self._cache.pop(url, None)
@@ -3,13 +3,14 @@ Block Operations Mixin
 Handles survey block creation and management
 """
 
-import requests
 from typing import Dict, Any
 
 
 class BlockMixin:
     """Mixin providing block operations"""
 
+    __slots__ = ()
+
     def get_blocks(self, survey_id: str) -> Dict[str, Any]:
         """
         Get all blocks in a survey by fetching the full survey definition
@@ -20,17 +21,11 @@ class BlockMixin:
         Returns:
             Dictionary with block details
         """
-        response = requests.get(
-            f'{self.base_url}/survey-definitions/{survey_id}',
-            headers=self.headers
-        )
-
-        if response.status_code == 200:
-            result = response.json()['result']
-            # Return just the blocks
-            return {'Elements': result.get('Blocks', {})}
-        else:
-            raise Exception(f"Failed to get blocks: {response.text}")
+        result = self._cached_get(
+            f'/survey-definitions/{survey_id}', "get blocks"
+        )['result']
+        # Return just the blocks
+        return {'Elements': result.get('Blocks', {})}
 
     def create_block(self, survey_id: str, block_name: str) -> Dict[str, Any]:
         """
@@ -48,13 +43,7 @@ class BlockMixin:
             "Type": "Standard"
         }
 
-        response = requests.post(
-            f'{self.base_url}/survey-definitions/{survey_id}/blocks',
-            headers=self.headers,
-            json=block_data
+        return self._request(
+            'POST', f'/survey-definitions/{survey_id}/blocks',
+            json=block_data, op="create block"
         )
-
-        if response.status_code == 200:
-            return response.json()['result']
-        else:
-            raise Exception(f"Failed to create block: {response.text}")
@@ -4,7 +4,6 @@ Handles survey flow branching — routing respondents to different blocks
 based on question answers, embedded data, or other conditions.
 """
 
-import requests
 from typing import Dict, List, Any, Optional, Union
 
 
@@ -16,6 +15,8 @@ class BranchLogicMixin:
     This is different from display logic (which shows/hides individual questions).
     """
 
+    __slots__ = ()
+
     def _build_branch_condition(
         self,
         source_question_id: str,
@@ -124,12 +125,10 @@ class BranchLogicMixin:
             raise ValueError("At least one condition is required")
         if not block_ids:
             raise ValueError("At least one block_id is required")
+        if position is not None and position < 0:
+            raise ValueError("position must be a non-negative index")
 
-        # Get current flow
-        current_flow = self.get_survey_flow(survey_id)
-        flow_list = current_flow.get("Flow", [])
-
-        # Build condition expressions
+        # Build condition expressions (validating them) before fetching the flow
         built = {}
         for i, cond in enumerate(conditions):
             expr = self._build_branch_condition(
@@ -152,17 +151,17 @@ class BranchLogicMixin:
             "0": if_block,
         }
 
+        current_flow = self.get_survey_flow(survey_id)
+        flow_list = current_flow.get("Flow", [])
+
         # Build inner flow (blocks shown when condition is true)
-        inner_flow = []
-        for bid in block_ids:
-            next_fid = self._get_next_flow_id(flow_list + inner_flow)
-            inner_flow.append({
-                "Type": "Standard",
-                "ID": bid,
-                "FlowID": next_fid,
-            })
-
-        branch_flow_id = self._get_next_flow_id(flow_list + inner_flow)
+        next_id = self._max_flow_id([current_flow]) + 1
+        inner_flow = [
+            {"Type": "Standard", "ID": bid, "FlowID": f"FL_{next_id + i}"}
+            for i, bid in enumerate(block_ids)
+        ]
+
+        branch_flow_id = f"FL_{next_id + len(inner_flow)}"
         branch_element = {
             "Type": "Branch",
             "FlowID": branch_flow_id,
@@ -197,25 +196,18 @@ class BranchLogicMixin:
             "Type": current_flow.get("Type", "Root"),
             "Flow": flow_list,
             "Properties": {
-                "Count": self._count_flow_elements(flow_list) + 1
+                "Count": next_id + len(inner_flow)
             },
         }
 
-        resp = requests.put(
-            f"{self.base_url}/survey-definitions/{survey_id}/flow",
-            headers=self.headers,
-            json=update_payload,
-        )
+        self._put_survey_flow(survey_id, update_payload, op="add branch")
 
-        if resp.status_code == 200:
-            return {
-                "FlowID": branch_flow_id,
-                "Description": description or "New Branch",
-                "block_ids": block_ids,
-                "success": True,
-            }
-        else:
-            raise Exception(f"Failed to add branch: {resp.text}")
+        return {
+            "FlowID": branch_flow_id,
+            "Description": description or "New Branch",
+            "block_ids": block_ids,
+            "success": True,
+        }
 
     def add_branch_simple(
         self,
@@ -65,4 +65,5 @@ class QualtricsAPI(
         ...     {"user_id": "12345", "source": "email"}
         ... )
     """
-    pass  # All methods inherited from mixins!
+
+    __slots__ = ()  # All methods inherited from mixins!
@@ -3,10 +3,16 @@ Display Logic Mixin
 Handles conditional display and skip logic for survey questions
 """
 
-import requests
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Union
 
 
+# Question IDs look like QID1; choice locators like q://QID1/SelectableChoice/1
+_QID_RE = re.compile(r'QID\w+')
+_CHOICE_LOCATOR_RE = re.compile(r'q://QID\w+(/\w+)+')
+
+
 class DisplayLogicMixin:
     """
     Mixin providing display logic and conditional display operations.
@@ -15,25 +21,136 @@ class DisplayLogicMixin:
     respondent answers, enabling adaptive survey experiences.
     """
 
+    __slots__ = ()
+
     # Supported operators for conditions
-    OPERATORS = {
-        'Selected': 'Selected',
-        'NotSelected': 'NotSelected',
-        'Displayed': 'Displayed',
-        'NotDisplayed': 'NotDisplayed',
-        'EqualTo': 'EqualTo',
-        'NotEqualTo': 'NotEqualTo',
-        'GreaterThan': 'GreaterThan',
-        'LessThan': 'LessThan',
-        'GreaterOrEqual': 'GreaterOrEqual',
-        'LessOrEqual': 'LessOrEqual',
-        'Contains': 'Contains',
-        'DoesNotContain': 'DoesNotContain',
-        'MatchesRegex': 'MatchesRegex',
-        'Empty': 'Empty',
-        'NotEmpty': 'NotEmpty'
+    OPERATORS = frozenset({
+        'Selected', 'NotSelected', 'Displayed', 'NotDisplayed',
+        'EqualTo', 'NotEqualTo', 'GreaterThan', 'LessThan',
+        'GreaterOrEqual', 'LessOrEqual', 'Contains', 'DoesNotContain',
+        'MatchesRegex', 'Empty', 'NotEmpty'
+    })
+
+    # Operator negations used by skip_if
+    _INVERSE_OPERATORS = {
+        'Selected': 'NotSelected',
+        'NotSelected': 'Selected',
+        'EqualTo': 'NotEqualTo',
+        'NotEqualTo': 'EqualTo',
+        'GreaterThan': 'LessOrEqual',
+        'LessThan': 'GreaterOrEqual',
+        'GreaterOrEqual': 'LessThan',
+        'LessOrEqual': 'GreaterThan',
+        'Contains': 'DoesNotContain',
+        'DoesNotContain': 'Contains',
+        'Empty': 'NotEmpty',
+        'NotEmpty': 'Empty',
+        'Displayed': 'NotDisplayed',
+        'NotDisplayed': 'Displayed'
+    }
+
+    # logic_type -> condition builder, used by _build_condition
+    _CONDITION_BUILDERS = {
+        'Question': '_build_question_condition',
+        'EmbeddedField': '_build_embedded_field_condition',
     }
 
+    # Optional question fields carried over when a question is re-PUT
+    _OPTIONAL_FIELDS = ('SubSelector', 'Choices', 'Answers', 'ChoiceOrder')
+
+    def _build_question_update_payload(
+        self,
+        current_question: Dict[str, Any],
+        question_id: str,
+        display_logic: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Build the PUT payload that replaces a question's display logic.
+
+        Args:
+            current_question: The question as returned by get_question
+            question_id: The question ID (used for a fallback DataExportTag)
+            display_logic: New display logic, or None to remove it
+
+        Returns:
+            Question payload - always includes DataExportTag, which the API requires
+        """
+        question_data = {
+            'QuestionText': current_question.get('QuestionText', ''),
+            'DataExportTag': current_question.get('DataExportTag', f'Q{question_id}'),
+            'QuestionType': current_question.get('QuestionType'),
+            'Selector': current_question.get('Selector'),
+            'DisplayLogic': display_logic
+        }
+        # Include optional fields (Answers is for matrix questions) if present
+        for field in self._OPTIONAL_FIELDS:
+            value = current_question.get(field)
+            if value:
+                question_data[field] = value
+        return question_data
+
+    def _validate_question_refs(
+        self,
+        *question_ids: str,
+        choice_locator: Optional[str] = None
+    ) -> None:
+        """
+        Check question IDs and a choice locator locally, before any request.
+
+        Args:
+            *question_ids: Question IDs that must look like 'QID1'
+            choice_locator: Optional locator that must look like
+                            'q://QID1/SelectableChoice/1'
+
+        Raises:
+            ValueError: If an ID or the locator is malformed
+        """
+        for question_id in question_ids:
+            if not isinstance(question_id, str) or not _QID_RE.fullmatch(question_id):
+                raise ValueError(f"Invalid question ID '{question_id}'. Expected an ID like 'QID1'")
+        if choice_locator is not None and not _CHOICE_LOCATOR_RE.fullmatch(choice_locator):
+            raise ValueError(
+                f"Invalid choice_locator '{choice_locator}'. "
+                "Expected a locator like 'q://QID1/SelectableChoice/1'"
+            )
+
+    def _put_question_with_display_logic(
+        self,
+        survey_id: str,
+        question_id: str,
+        display_logic: Optional[Dict[str, Any]],
+        op: str
+    ) -> bool:
+        """
+        Replace a question's display logic (GET, rebuild payload, PUT).
+
+        The PUT is skipped when the question already has exactly this
+        display logic, so re-running a setup script costs no writes.
+
+        Args:
+            survey_id: The survey ID
+            question_id: The question ID
+            display_logic: New display logic, or None to remove it
+            op: Description used in the error message (e.g. "add display logic")
+
+        Returns:
+            True if successful
+        """
+        current_question = self.get_question(survey_id, question_id)
+        if current_question.get('DisplayLogic') == display_logic:
+            return True
+        question_data = self._build_question_update_payload(
+            current_question, question_id, display_logic
+        )
+
+        path = f'/survey-definitions/{survey_id}/questions/{question_id}'
+        result = self._request(
+            'PUT', path, json=question_data, op=op, parse_result=False
+        )
+        # Keep the updated question cached so follow-up edits skip the GET
+        self._store_cached(path, {'result': {**current_question, **question_data}})
+        return result
+
     def _build_condition(
         self,
         question_id: str,
@@ -50,46 +167,84 @@ class DisplayLogicMixin:
             operator: The comparison operator (see OPERATORS)
             choice_locator: Choice identifier for multi-choice questions (e.g., 'q://QID1/SelectableChoice/1')
             value: Value for comparison operators
-            logic_type: Type of logic ('Question', 'EmbeddedField', etc.)
+            logic_type: Type of logic (a key of _CONDITION_BUILDERS)
 
         Returns:
             Dictionary representing the condition
+
+        Raises:
+            ValueError: If logic_type is not supported
         """
-        condition = {
+        builder = self._CONDITION_BUILDERS.get(logic_type)
+        if builder is None:
+            raise ValueError(
+                f"Invalid logic_type '{logic_type}'. "
+                f"Valid types: {list(self._CONDITION_BUILDERS.keys())}"
+            )
+        return getattr(self, builder)(question_id, operator, choice_locator, value)
+
+    def _build_question_condition(
+        self,
+        question_id: str,
+        operator: str,
+        choice_locator: Optional[str],
+        value: Optional[Union[str, int, float]]
+    ) -> Dict[str, Any]:
+        """Build a condition on a question's answer (see _build_condition)."""
+        if choice_locator:
+            # For multiple choice questions with Selected/NotSelected operators
+            return {
+                'Type': 'Expression',
+                'LogicType': 'Question',
+                'QuestionID': question_id,
+                'QuestionIsInLoop': 'no',
+                'ChoiceLocator': choice_locator,
+                'QuestionIDFromLocator': question_id,
+                'LeftOperand': choice_locator,
+                'Operator': operator
+            }
+        if value is not None:
+            # For numeric/text comparisons (slider, text entry, etc.)
+            # For sliders, we need to reference the choice by number, not by a complex path
+            # The LeftOperand references the answer value, ChoiceLocator identifies which slider
+            locator = f'q://{question_id}/ChoiceNumericEntryValue/1'
+            return {
+                'Type': 'Expression',
+                'LogicType': 'Question',
+                'QuestionID': question_id,
+                'QuestionIsInLoop': 'no',
+                'LeftOperand': locator,
+                'Operator': operator,
+                'RightOperand': value if isinstance(value, str) else str(value),
+                'QuestionIDFromLocator': question_id,
+                'ChoiceLocator': locator
+            }
+        # Fallback for other operators without specific choice or value
+        return {
             'Type': 'Expression',
-            'LogicType': logic_type
+            'LogicType': 'Question',
+            'QuestionID': question_id,
+            'QuestionIsInLoop': 'no',
+            'LeftOperand': f'q://{question_id}/SelectableChoice',
+            'Operator': operator
         }
 
-        if logic_type == 'Question':
-            condition['QuestionID'] = question_id
-            condition['QuestionIsInLoop'] = 'no'
-
-            if choice_locator:
-                # For multiple choice questions with Selected/NotSelected operators
-                condition['ChoiceLocator'] = choice_locator
-                condition['QuestionIDFromLocator'] = question_id
-                condition['LeftOperand'] = choice_locator
-                condition['Operator'] = operator
-            elif value is not None:
-                # For numeric/text comparisons (slider, text entry, etc.)
-                # For sliders, we need to reference the choice by number, not by a complex path
-                # The LeftOperand references the answer value, ChoiceLocator identifies which slider
-                condition['LeftOperand'] = f'q://{question_id}/ChoiceNumericEntryValue/1'
-                condition['Operator'] = operator
-                condition['RightOperand'] = str(value)
-                condition['QuestionIDFromLocator'] = question_id
-                condition['ChoiceLocator'] = f'q://{question_id}/ChoiceNumericEntryValue/1'
-            else:
-                # Fallback for other operators without specific choice or value
-                condition['LeftOperand'] = f'q://{question_id}/SelectableChoice'
-                condition['Operator'] = operator
-
-        elif logic_type == 'EmbeddedField':
-            condition['LeftOperand'] = question_id
-            condition['Operator'] = operator
-            if value is not None:
-                condition['RightOperand'] = str(value)
-
+    def _build_embedded_field_condition(
+        self,
+        field_name: str,
+        operator: str,
+        choice_locator: Optional[str],
+        value: Optional[Union[str, int, float]]
+    ) -> Dict[str, Any]:
+        """Build a condition on an embedded data field (see _build_condition)."""
+        condition = {
+            'Type': 'Expression',
+            'LogicType': 'EmbeddedField',
+            'LeftOperand': field_name,
+            'Operator': operator
+        }
+        if value is not None:
+            condition['RightOperand'] = value if isinstance(value, str) else str(value)
         return condition
 
     def add_display_logic(
@@ -128,7 +283,11 @@ class DisplayLogicMixin:
             )
         """
         if operator not in self.OPERATORS:
-            raise ValueError(f"Invalid operator '{operator}'. Valid operators: {list(self.OPERATORS.keys())}")
+            raise ValueError(
+                f"Invalid operator '{operator}'. "
+                f"Valid operators: {sorted(self.OPERATORS)}"
+            )
+        self._validate_question_refs(question_id, source_question_id, choice_locator=choice_locator)
 
         condition = self._build_condition(
             question_id=source_question_id,
@@ -146,45 +305,10 @@ class DisplayLogicMixin:
             }
         }
 
-        # Get current question data first
-        current_question = self.get_question(survey_id, question_id)
-
-        # Update question with display logic - MUST include DataExportTag
-        question_data = {
-            'QuestionText': current_question.get('QuestionText', ''),
-            'DataExportTag': current_question.get('DataExportTag', f'Q{question_id}'),
-            'QuestionType': current_question.get('QuestionType'),
-            'Selector': current_question.get('Selector'),
-            'DisplayLogic': display_logic
-        }
-
-        # Include SubSelector if present
-        if current_question.get('SubSelector'):
-            question_data['SubSelector'] = current_question['SubSelector']
-
-        # Include Choices if present
-        if current_question.get('Choices'):
-            question_data['Choices'] = current_question['Choices']
-
-        # Include Answers if present (for matrix questions)
-        if current_question.get('Answers'):
-            question_data['Answers'] = current_question['Answers']
-
-        # Include ChoiceOrder if present
-        if current_question.get('ChoiceOrder'):
-            question_data['ChoiceOrder'] = current_question['ChoiceOrder']
-
-        response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}/questions/{question_id}',
-            headers=self.headers,
-            json=question_data
+        return self._put_question_with_display_logic(
+            survey_id, question_id, display_logic, op="add display logic"
         )
 
-        if response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to add display logic: {response.text}")
-
     def add_display_logic_multiple(
         self,
         survey_id: str,
@@ -234,21 +358,38 @@ class DisplayLogicMixin:
         if not conditions:
             raise ValueError("At least one condition is required")
 
+        # Validate every condition before building anything, cheapest checks
+        # first, reporting all bad conditions at once
+        operators = self.OPERATORS
+        invalid = []
+        for i, cond in enumerate(conditions):
+            if cond.get('operator') not in operators:
+                invalid.append(f"Invalid operator '{cond.get('operator')}' in condition {i}")
+            if 'source_question_id' not in cond:
+                invalid.append(f"Missing source_question_id in condition {i}")
+        if invalid:
+            raise ValueError('; '.join(invalid))
+
+        self._validate_question_refs(question_id)
+        for cond in conditions:
+            self._validate_question_refs(
+                cond['source_question_id'], choice_locator=cond.get('choice_locator')
+            )
+
         # Build all conditions
+        # Qualtrics API requires "And" or "Or" (capitalized first letter only)
+        joiner = conjunction.capitalize()
+        build = self._build_condition
         built_conditions = {}
         for i, cond in enumerate(conditions):
-            if cond.get('operator') not in self.OPERATORS:
-                raise ValueError(f"Invalid operator '{cond.get('operator')}' in condition {i}")
-
-            built_conditions[str(i)] = self._build_condition(
+            built_conditions[str(i)] = build(
                 question_id=cond['source_question_id'],
                 operator=cond['operator'],
                 choice_locator=cond.get('choice_locator'),
                 value=cond.get('value')
             )
             if i > 0:
-                # Qualtrics API requires "And" or "Or" (capitalized first letter only)
-                built_conditions[str(i)]['Conjunction'] = conjunction.capitalize()
+                built_conditions[str(i)]['Conjunction'] = joiner
 
         # Build the expression
         if_block = {
@@ -262,44 +403,80 @@ class DisplayLogicMixin:
             '0': if_block
         }
 
-        # Get current question data first
-        current_question = self.get_question(survey_id, question_id)
-
-        # Update question with display logic - MUST include DataExportTag
-        question_data = {
-            'QuestionText': current_question.get('QuestionText', ''),
-            'DataExportTag': current_question.get('DataExportTag', f'Q{question_id}'),
-            'QuestionType': current_question.get('QuestionType'),
-            'Selector': current_question.get('Selector'),
-            'DisplayLogic': display_logic
-        }
+        return self._put_question_with_display_logic(
+            survey_id, question_id, display_logic, op="add display logic"
+        )
 
-        # Include SubSelector if present
-        if current_question.get('SubSelector'):
-            question_data['SubSelector'] = current_question['SubSelector']
+    def add_display_logic_batch(
+        self,
+        survey_id: str,
+        rules: List[Dict[str, Any]],
+        max_workers: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        Add display logic to many questions concurrently.
 
-        # Include Choices if present
-        if current_question.get('Choices'):
-            question_data['Choices'] = current_question['Choices']
+        Fetches the survey definition once to prefetch every target question
+        (instead of one GET per rule), then sends the PUTs from a thread pool.
+        A failing rule is reported in the results rather than raised, so it
+        does not abort the rest of the batch.
 
-        # Include Answers if present (for matrix questions)
-        if current_question.get('Answers'):
-            question_data['Answers'] = current_question['Answers']
+        Args:
+            survey_id: The survey ID
+            rules: List of rule dictionaries, each with a question_id plus either
+                the add_display_logic arguments (source_question_id, operator,
+                choice_locator, value) or the add_display_logic_multiple
+                arguments (conditions, conjunction). Each question may appear
+                in only one rule.
+            max_workers: Maximum number of concurrent requests (default: 16)
 
-        # Include ChoiceOrder if present
-        if current_question.get('ChoiceOrder'):
-            question_data['ChoiceOrder'] = current_question['ChoiceOrder']
+        Returns:
+            One dictionary per rule, in input order, with question_id,
+            success (bool) and error (the exception, or None)
 
-        response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}/questions/{question_id}',
-            headers=self.headers,
-            json=question_data
-        )
+        Example:
+            results = api.add_display_logic_batch(survey_id, [
+                {"question_id": "QID2", "source_question_id": "QID1",
+                 "operator": "Selected", "choice_locator": "q://QID1/SelectableChoice/1"},
+                {"question_id": "QID4", "source_question_id": "QID3",
+                 "operator": "GreaterThan", "value": 5},
+            ])
+            failed = [r for r in results if not r["success"]]
+        """
+        question_ids = [rule['question_id'] for rule in rules]
+        if len(set(question_ids)) != len(question_ids):
+            raise ValueError(
+                "Each question may appear in only one rule; "
+                "combine its conditions with 'conditions' instead"
+            )
+        if not rules:
+            return []
+
+        # The survey definition embeds every question, so one GET seeds the
+        # cache that add_display_logic reads from
+        survey_questions = self.get_survey(survey_id).get('Questions', {})
+        for question_id in question_ids:
+            if question_id in survey_questions:
+                self._store_cached(
+                    f'/survey-definitions/{survey_id}/questions/{question_id}',
+                    {'result': survey_questions[question_id]}
+                )
+
+        def apply(rule):
+            kwargs = dict(rule)
+            question_id = kwargs.pop('question_id')
+            if 'conditions' in kwargs:
+                add = self.add_display_logic_multiple
+            else:
+                add = self.add_display_logic
+            try:
+                add(survey_id, question_id, **kwargs)
+            except Exception as error:
+                return {'question_id': question_id, 'success': False, 'error': error}
+            return {'question_id': question_id, 'success': True, 'error': None}
 
-        if response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to add display logic: {response.text}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(apply, rules))
 
     def skip_if(
         self,
@@ -340,31 +517,14 @@ class DisplayLogicMixin:
             )
         """
         # For skip logic, we invert the operator or use NotSelected
-        inverse_operators = {
-            'Selected': 'NotSelected',
-            'NotSelected': 'Selected',
-            'EqualTo': 'NotEqualTo',
-            'NotEqualTo': 'EqualTo',
-            'GreaterThan': 'LessOrEqual',
-            'LessThan': 'GreaterOrEqual',
-            'GreaterOrEqual': 'LessThan',
-            'LessOrEqual': 'GreaterThan',
-            'Contains': 'DoesNotContain',
-            'DoesNotContain': 'Contains',
-            'Empty': 'NotEmpty',
-            'NotEmpty': 'Empty',
-            'Displayed': 'NotDisplayed',
-            'NotDisplayed': 'Displayed'
-        }
-
-        inverted_operator = inverse_operators.get(operator, operator)
+        inverted_operator = self._INVERSE_OPERATORS.get(operator, operator)
 
         return self.add_display_logic(
             survey_id=survey_id,
             question_id=question_id,
             source_question_id=source_question_id,
             operator=inverted_operator,
-            choice_locator=choice_locator.replace(f'/{choice_locator.split("/")[-1]}', f'/{choice_locator.split("/")[-1]}') if choice_locator and operator in ['Selected', 'NotSelected'] else choice_locator,
+            choice_locator=choice_locator,
             value=value
         )
 
@@ -427,6 +587,7 @@ class DisplayLogicMixin:
         Returns:
             Dictionary with display logic or None if no logic set
         """
+        self._validate_question_refs(question_id)
         question = self.get_question(survey_id, question_id)
         return question.get('DisplayLogic')
 
@@ -445,45 +606,12 @@ class DisplayLogicMixin:
         Returns:
             True if successful
         """
-        # Get current question data first
-        current_question = self.get_question(survey_id, question_id)
-
-        # Update question without display logic - MUST include DataExportTag
-        question_data = {
-            'QuestionText': current_question.get('QuestionText', ''),
-            'DataExportTag': current_question.get('DataExportTag', f'Q{question_id}'),
-            'QuestionType': current_question.get('QuestionType'),
-            'Selector': current_question.get('Selector'),
-            'DisplayLogic': None
-        }
-
-        # Include SubSelector if present
-        if current_question.get('SubSelector'):
-            question_data['SubSelector'] = current_question['SubSelector']
+        self._validate_question_refs(question_id)
 
-        # Include Choices if present
-        if current_question.get('Choices'):
-            question_data['Choices'] = current_question['Choices']
-
-        # Include Answers if present (for matrix questions)
-        if current_question.get('Answers'):
-            question_data['Answers'] = current_question['Answers']
-
-        # Include ChoiceOrder if present
-        if current_question.get('ChoiceOrder'):
-            question_data['ChoiceOrder'] = current_question['ChoiceOrder']
-
-        response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}/questions/{question_id}',
-            headers=self.headers,
-            json=question_data
+        return self._put_question_with_display_logic(
+            survey_id, question_id, None, op="delete display logic"
         )
 
-        if response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to delete display logic: {response.text}")
-
     def add_embedded_data_logic(
         self,
         survey_id: str,
@@ -516,7 +644,11 @@ class DisplayLogicMixin:
             )
         """
         if operator not in self.OPERATORS:
-            raise ValueError(f"Invalid operator '{operator}'. Valid operators: {list(self.OPERATORS.keys())}")
+            raise ValueError(
+                f"Invalid operator '{operator}'. "
+                f"Valid operators: {sorted(self.OPERATORS)}"
+            )
+        self._validate_question_refs(question_id)
 
         condition = self._build_condition(
             question_id=field_name,
@@ -534,41 +666,6 @@ class DisplayLogicMixin:
             }
         }
 
-        # Get current question data first
-        current_question = self.get_question(survey_id, question_id)
-
-        # Update question with display logic - MUST include DataExportTag
-        question_data = {
-            'QuestionText': current_question.get('QuestionText', ''),
-            'DataExportTag': current_question.get('DataExportTag', f'Q{question_id}'),
-            'QuestionType': current_question.get('QuestionType'),
-            'Selector': current_question.get('Selector'),
-            'DisplayLogic': display_logic
-        }
-
-        # Include SubSelector if present
-        if current_question.get('SubSelector'):
-            question_data['SubSelector'] = current_question['SubSelector']
-
-        # Include Choices if present
-        if current_question.get('Choices'):
-            question_data['Choices'] = current_question['Choices']
-
-        # Include Answers if present (for matrix questions)
-        if current_question.get('Answers'):
-            question_data['Answers'] = current_question['Answers']
-
-        # Include ChoiceOrder if present
-        if current_question.get('ChoiceOrder'):
-            question_data['ChoiceOrder'] = current_question['ChoiceOrder']
-
-        response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}/questions/{question_id}',
-            headers=self.headers,
-            json=question_data
+        return self._put_question_with_display_logic(
+            survey_id, question_id, display_logic, op="add embedded data logic"
         )
-
-        if response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to add embedded data logic: {response.text}")
@@ -3,198 +3,278 @@ Embedded Data Operations Mixin
 Handles embedded data field configuration and URL generation
 """
 
-import requests
-from typing import Dict, List, Any, Optional
-from urllib.parse import urlencode
-import re
+from typing import Callable, Dict, List, Any, Optional, Tuple
+from urllib.parse import quote, quote_plus
+from concurrent.futures import ThreadPoolExecutor
+
+from .exceptions import QualtricsAPIError
+from ..utils.serialization import dumps
+
+
+_FIELD_TYPES = frozenset({"text", "number", "date"})
+_POSITIONS = frozenset({"start", "end"})
+
+
+def _quote_query_value(value: Any) -> str:
+    """quote_plus() a query key or value, passing plain ASCII alphanumerics through."""
+    if isinstance(value, str):
+        if value.isascii() and value.isalnum():
+            return value
+        return quote_plus(value)
+    return quote_plus(value if isinstance(value, bytes) else str(value))
 
 
 class EmbeddedDataMixin:
     """Mixin providing embedded data operations for Qualtrics surveys"""
 
+    __slots__ = ()
+
     def get_survey_flow(self, survey_id: str) -> Dict[str, Any]:
         """
         Get the raw survey flow structure (for debugging).
 
+        Served from the read cache, so the flow edits below cost one GET for
+        a run of consecutive edits rather than one per edit. Any other write
+        to the survey (e.g. creating a block) drops the cached flow.
+
         Args:
             survey_id: The survey ID
 
         Returns:
             The complete flow structure from the API
         """
-        flow_response = requests.get(
-            f'{self.base_url}/survey-definitions/{survey_id}/flow',
-            headers=self.headers
-        )
+        return self._cached_get(
+            f'/survey-definitions/{survey_id}/flow', "get survey flow"
+        )['result']
 
-        if flow_response.status_code != 200:
-            raise Exception(f"Failed to get survey flow: {flow_response.text}")
-
-        return flow_response.json()['result']
-
-    def _get_next_flow_id(self, flow_list: List[Dict]) -> str:
-        """Generate a unique FlowID by finding the max existing ID and incrementing."""
-        max_id = 0
-        for element in flow_list:
-            flow_id = element.get('FlowID', '')
-            match = re.match(r'FL_(\d+)', flow_id)
-            if match:
-                max_id = max(max_id, int(match.group(1)))
-            # Also check nested flows
-            if 'Flow' in element and isinstance(element['Flow'], list):
-                for nested in element['Flow']:
-                    nested_id = nested.get('FlowID', '')
-                    match = re.match(r'FL_(\d+)', nested_id)
-                    if match:
-                        max_id = max(max_id, int(match.group(1)))
-        return f"FL_{max_id + 1}"
-
-    def _count_flow_elements(self, flow_list: List[Dict]) -> int:
-        """Count total flow elements including nested ones."""
-        count = 0
-        for element in flow_list:
-            count += 1
-            if 'Flow' in element and isinstance(element['Flow'], list):
-                count += self._count_flow_elements(element['Flow'])
-        return count
-
-    def set_embedded_data(
+    def _put_survey_flow(
         self,
         survey_id: str,
-        field_name: str,
-        field_type: str = "text",
-        value: Optional[str] = None,
-        position: str = "start"
-    ) -> Dict[str, Any]:
+        flow: Dict[str, Any],
+        op: str,
+        changed_element: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
-        Configure an individual embedded data field in a survey.
+        Replace the survey flow and keep the new flow cached for the next edit.
+
+        When the edit only changed one existing top-level element, just that
+        element is sent (PUT .../flow/{FlowID}), so the request body scales
+        with the change rather than the whole flow. If the element update is
+        rejected, the complete flow is sent instead.
 
         Args:
             survey_id: The survey ID
-            field_name: Name of the embedded data field
-            field_type: Type of field - "text", "number", or "date" (default: "text")
-            value: Optional default value for the field (can use Qualtrics piped text)
-            position: Where to place in flow - "start" or "end" (default: "start")
-                      Use "start" for data passed via URL or static values.
-                      Use "end" for capturing question answers with piped text.
+            flow: The complete flow (FlowID, Type, Flow, Properties)
+            op: Description used in the error message (e.g. "set embedded data")
+            changed_element: The only flow element the edit modified, if any
+        """
+        path = f'/survey-definitions/{survey_id}/flow'
+        sent = False
+        if changed_element is not None and changed_element.get('FlowID'):
+            try:
+                sent = self._request(
+                    'PUT', f"{path}/{changed_element['FlowID']}",
+                    json=changed_element, op=op, parse_result=False
+                )
+            except QualtricsAPIError:
+                pass  # fall back to replacing the whole flow
+        if not sent:
+            self._request('PUT', path, json=flow, op=op, parse_result=False)
+        self._store_cached(path, {'result': flow})
+
+    @classmethod
+    def _get_next_flow_id(cls, flow_list: List[Dict]) -> str:
+        """Generate a unique FlowID by finding the max existing ID and incrementing."""
+        return f"FL_{cls._max_flow_id(flow_list) + 1}"
 
-        Returns:
-            Dictionary with the embedded data field configuration
+    @staticmethod
+    def _max_flow_id(flow_list: List[Dict]) -> int:
+        """
+        Return the highest FL_<n> number used anywhere in the flow (0 if none).
 
-        Raises:
-            Exception: If the API call fails
-            ValueError: If field_type is not valid
+        Scans nested flows at every depth. Callers adding several elements
+        scan once and number them max + 1, max + 2, ...; the last of those is
+        then the flow's new Properties.Count (the FlowID counter Qualtrics
+        allocates from), so no second walk is needed to recount the flow.
         """
-        valid_types = ["text", "number", "date"]
-        if field_type not in valid_types:
-            raise ValueError(f"field_type must be one of {valid_types}")
+        max_id = 0
+        stack = [flow_list]
+        while stack:
+            for element in stack.pop():
+                flow_id = element.get('FlowID', '')
+                if flow_id.startswith('FL_') and flow_id[3:].isdecimal():
+                    max_id = max(max_id, int(flow_id[3:]))
+                nested = element.get('Flow')
+                if isinstance(nested, list):
+                    stack.append(nested)
+        return max_id
+
+    @staticmethod
+    def _merge_embedded_data(
+        existing_fields: List[Dict[str, Any]],
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Update fields that already exist (matched by name) and append the rest."""
+        by_name = {f.get('Field'): f for f in existing_fields}
+        for item in items:
+            if item['Field'] in by_name:
+                by_name[item['Field']].update(item)
+            else:
+                existing_fields.append(item)
+                by_name[item['Field']] = item
+        return existing_fields
 
-        if position not in ["start", "end"]:
-            raise ValueError("position must be 'start' or 'end'")
+    @staticmethod
+    def _embedded_data_items(fields: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate field configs and build their flow EmbeddedData items."""
+        embedded_data_items = []
+        for field_name, config in fields.items():
+            if not isinstance(field_name, str) or not field_name.strip():
+                raise ValueError(
+                    "Embedded data field name must be a non-empty string, "
+                    f"got {field_name!r}"
+                )
+            if config.get("type", "text") not in _FIELD_TYPES:
+                raise ValueError(
+                    f"field_type for '{field_name}' must be one of {sorted(_FIELD_TYPES)}"
+                )
 
-        # Get current survey flow
-        flow_response = requests.get(
-            f'{self.base_url}/survey-definitions/{survey_id}/flow',
-            headers=self.headers
-        )
+            # Use "Custom" type when setting a value, "Recipient" when expecting from URL
+            value = config.get("value")
+            if value is None:
+                item = {"Description": field_name, "Type": "Recipient",
+                        "Field": field_name, "VariableType": "String"}
+            else:
+                item = {"Description": field_name, "Type": "Custom",
+                        "Field": field_name, "VariableType": "String", "Value": value}
 
-        if flow_response.status_code != 200:
-            raise Exception(f"Failed to get survey flow: {flow_response.text}")
+            embedded_data_items.append(item)
+        return embedded_data_items
+
+    @classmethod
+    def _flow_with_embedded_data(
+        cls,
+        current_flow: Dict[str, Any],
+        embedded_data_items: List[Dict[str, Any]],
+        position: str
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Merge the items into the flow at position.
 
-        current_flow = flow_response.json()['result']
+        Returns:
+            The flow update payload, and the existing EmbeddedData element
+            the items were merged into (None when a new element was inserted)
+        """
         flow_list = current_flow.get('Flow', [])
+        changed_element = None
 
-        # Build the embedded data field item
-        # Use "Custom" type when setting a value, "Recipient" when expecting from URL
-        field_item = {
-            "Description": field_name,
-            "Type": "Custom" if value is not None else "Recipient",
-            "Field": field_name,
-            "VariableType": "String"
-        }
-
-        if value is not None:
-            field_item["Value"] = value
-
-        # Find the right position to insert
+        # Insert based on position
         if position == "start":
-            insert_idx = 0
             # Check if first element is already EmbeddedData
             if flow_list and flow_list[0].get('Type') == 'EmbeddedData':
-                # Add to existing first EmbeddedData block
-                existing_fields = flow_list[0].get('EmbeddedData', [])
-                field_exists = any(f.get('Field') == field_name for f in existing_fields)
-                if field_exists:
-                    for f in existing_fields:
-                        if f.get('Field') == field_name:
-                            f.update(field_item)
-                            break
-                else:
-                    existing_fields.append(field_item)
-                flow_list[0]['EmbeddedData'] = existing_fields
+                changed_element = flow_list[0]
+                changed_element['EmbeddedData'] = cls._merge_embedded_data(
+                    changed_element.get('EmbeddedData', []), embedded_data_items
+                )
             else:
                 # Create new EmbeddedData block at start
                 new_element = {
                     "Type": "EmbeddedData",
-                    "FlowID": self._get_next_flow_id(flow_list),
-                    "EmbeddedData": [field_item]
+                    "FlowID": cls._get_next_flow_id([current_flow]),
+                    "EmbeddedData": embedded_data_items
                 }
                 flow_list.insert(0, new_element)
         else:  # position == "end"
-            # Find or create EmbeddedData at the end (before EndSurvey if present)
+            # Find end position (before EndSurvey if present)
             end_idx = len(flow_list)
             for i, element in enumerate(flow_list):
                 if element.get('Type') == 'EndSurvey':
                     end_idx = i
                     break
 
-            # Check if there's already an EmbeddedData right before end position
-            if end_idx > 0 and flow_list[end_idx - 1].get('Type') == 'EmbeddedData':
-                # Add to existing end EmbeddedData block
-                existing_fields = flow_list[end_idx - 1].get('EmbeddedData', [])
-                field_exists = any(f.get('Field') == field_name for f in existing_fields)
-                if field_exists:
-                    for f in existing_fields:
-                        if f.get('Field') == field_name:
-                            f.update(field_item)
-                            break
-                else:
-                    existing_fields.append(field_item)
-                flow_list[end_idx - 1]['EmbeddedData'] = existing_fields
+            # Check if there's already an EmbeddedData right before end
+            # But NOT at position 0 (that's the start block)
+            if end_idx > 1 and flow_list[end_idx - 1].get('Type') == 'EmbeddedData':
+                changed_element = flow_list[end_idx - 1]
+                changed_element['EmbeddedData'] = cls._merge_embedded_data(
+                    changed_element.get('EmbeddedData', []), embedded_data_items
+                )
             else:
                 # Create new EmbeddedData block at end
                 new_element = {
                     "Type": "EmbeddedData",
-                    "FlowID": self._get_next_flow_id(flow_list),
-                    "EmbeddedData": [field_item]
+                    "FlowID": cls._get_next_flow_id([current_flow]),
+                    "EmbeddedData": embedded_data_items
                 }
                 flow_list.insert(end_idx, new_element)
 
+        properties = current_flow.get("Properties", {"Count": len(flow_list)})
+        if changed_element is None:
+            # Keep the FlowID counter at or above the ID just allocated,
+            # without re-walking the flow
+            new_id = int(new_element["FlowID"][3:])
+            count = properties.get("Count")
+            if not isinstance(count, int) or count < new_id:
+                properties = {**properties, "Count": new_id}
+
         # Build the update payload with only required fields
         update_payload = {
             "FlowID": current_flow.get("FlowID", "FL_1"),
             "Type": current_flow.get("Type", "Root"),
             "Flow": flow_list,
-            "Properties": current_flow.get("Properties", {"Count": len(flow_list)})
+            "Properties": properties
         }
+        return update_payload, changed_element
 
-        # Update the flow
-        update_response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}/flow',
-            headers=self.headers,
-            json=update_payload
-        )
+    def set_embedded_data(
+        self,
+        survey_id: str,
+        field_name: str,
+        field_type: str = "text",
+        value: Optional[str] = None,
+        position: str = "start"
+    ) -> Dict[str, Any]:
+        """
+        Configure an individual embedded data field in a survey.
 
-        if update_response.status_code == 200:
-            return {
-                "field_name": field_name,
-                "field_type": field_type,
-                "value": value,
-                "position": position,
-                "success": True
-            }
-        else:
-            raise Exception(f"Failed to set embedded data: {update_response.text}")
+        Each call costs a flow update. To configure several fields, pass them
+        all to set_embedded_data_fields() instead, which applies them in a
+        single update.
+
+        Args:
+            survey_id: The survey ID
+            field_name: Name of the embedded data field
+            field_type: Type of field - "text", "number", or "date" (default: "text")
+            value: Optional default value for the field (can use Qualtrics piped text)
+            position: Where to place in flow - "start" or "end" (default: "start")
+                      Use "start" for data passed via URL or static values.
+                      Use "end" for capturing question answers with piped text.
+
+        Returns:
+            Dictionary with the embedded data field configuration
+
+        Raises:
+            Exception: If the API call fails
+            ValueError: If field_type is not valid
+        """
+        if field_type not in _FIELD_TYPES:
+            raise ValueError(f"field_type must be one of {sorted(_FIELD_TYPES)}")
+
+        if position not in _POSITIONS:
+            raise ValueError("position must be 'start' or 'end'")
+
+        field_config = {"type": field_type}
+        if value is not None:
+            field_config["value"] = value
+        self.set_embedded_data_fields(survey_id, {field_name: field_config}, position=position)
+
+        return {
+            "field_name": field_name,
+            "field_type": field_type,
+            "value": value,
+            "position": position,
+            "success": True
+        }
 
     def set_embedded_data_fields(
         self,
@@ -233,130 +313,60 @@ class EmbeddedDataMixin:
             ...     "user_answer": {"type": "text", "value": "${q://QID1/ChoiceGroup/SelectedChoices}"}
             ... }, position="end")
         """
-        if position not in ["start", "end"]:
-            raise ValueError("position must be 'start' or 'end'")
-
-        # Get current survey flow
-        flow_response = requests.get(
-            f'{self.base_url}/survey-definitions/{survey_id}/flow',
-            headers=self.headers
-        )
-
-        if flow_response.status_code != 200:
-            raise Exception(f"Failed to get survey flow: {flow_response.text}")
-
-        current_flow = flow_response.json()['result']
-        flow_list = current_flow.get('Flow', [])
-
-        # Build embedded data items for all fields
-        embedded_data_items = []
-        for field_name, config in fields.items():
-            field_type = config.get("type", "text")
-            value = config.get("value")
-
-            valid_types = ["text", "number", "date"]
-            if field_type not in valid_types:
-                raise ValueError(
-                    f"field_type for '{field_name}' must be one of {valid_types}"
-                )
-
-            # Build the embedded data field item
-            # Use "Custom" type when setting a value, "Recipient" when expecting from URL
-            item = {
-                "Description": field_name,
-                "Type": "Custom" if value is not None else "Recipient",
-                "Field": field_name,
-                "VariableType": "String"
-            }
+        # The flow is only fetched once the fields have been validated
+        with _FlowTransaction(self, survey_id, op="set embedded data fields") as transaction:
+            transaction.set_fields(fields, position)
+
+        return {
+            "fields": list(fields.keys()),
+            "count": len(fields),
+            "position": position,
+            "success": True
+        }
 
-            if value is not None:
-                item["Value"] = value
+    def set_embedded_data_fields_bulk(
+        self,
+        survey_fields: Dict[str, Dict[str, Dict[str, Any]]],
+        position: str = "start",
+        max_workers: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        Configure embedded data fields on many surveys concurrently.
 
-            embedded_data_items.append(item)
+        Runs set_embedded_data_fields for each survey from a thread pool
+        sharing the client's connection pool. A failing survey is reported
+        in the results rather than raised, so it does not abort the batch.
 
-        # Insert based on position
-        if position == "start":
-            # Check if first element is already EmbeddedData
-            if flow_list and flow_list[0].get('Type') == 'EmbeddedData':
-                existing_fields = flow_list[0].get('EmbeddedData', [])
-                existing_names = {f.get('Field') for f in existing_fields}
-
-                for item in embedded_data_items:
-                    if item['Field'] in existing_names:
-                        # Update existing
-                        for f in existing_fields:
-                            if f.get('Field') == item['Field']:
-                                f.update(item)
-                                break
-                    else:
-                        existing_fields.append(item)
-
-                flow_list[0]['EmbeddedData'] = existing_fields
-            else:
-                # Create new EmbeddedData block at start
-                new_element = {
-                    "Type": "EmbeddedData",
-                    "FlowID": self._get_next_flow_id(flow_list),
-                    "EmbeddedData": embedded_data_items
-                }
-                flow_list.insert(0, new_element)
-        else:  # position == "end"
-            # Find end position (before EndSurvey if present)
-            end_idx = len(flow_list)
-            for i, element in enumerate(flow_list):
-                if element.get('Type') == 'EndSurvey':
-                    end_idx = i
-                    break
+        Args:
+            survey_fields: Mapping of survey ID to its fields (same format as
+                           set_embedded_data_fields)
+            position: Where to place the fields in each flow - "start" or "end"
+            max_workers: Maximum number of concurrent surveys (default: 16)
 
-            # Check if there's already an EmbeddedData right before end
-            # But NOT at position 0 (that's the start block)
-            if end_idx > 1 and flow_list[end_idx - 1].get('Type') == 'EmbeddedData':
-                existing_fields = flow_list[end_idx - 1].get('EmbeddedData', [])
-                existing_names = {f.get('Field') for f in existing_fields}
-
-                for item in embedded_data_items:
-                    if item['Field'] in existing_names:
-                        for f in existing_fields:
-                            if f.get('Field') == item['Field']:
-                                f.update(item)
-                                break
-                    else:
-                        existing_fields.append(item)
-
-                flow_list[end_idx - 1]['EmbeddedData'] = existing_fields
-            else:
-                # Create new EmbeddedData block at end
-                new_element = {
-                    "Type": "EmbeddedData",
-                    "FlowID": self._get_next_flow_id(flow_list),
-                    "EmbeddedData": embedded_data_items
-                }
-                flow_list.insert(end_idx, new_element)
+        Returns:
+            One dictionary per survey, in input order, with survey_id,
+            success (bool) and error (the exception, or None)
 
-        # Build the update payload with only required fields
-        update_payload = {
-            "FlowID": current_flow.get("FlowID", "FL_1"),
-            "Type": current_flow.get("Type", "Root"),
-            "Flow": flow_list,
-            "Properties": current_flow.get("Properties", {"Count": len(flow_list)})
-        }
+        Example:
+            results = api.set_embedded_data_fields_bulk({
+                survey_id: {"cohort": {"type": "text", "value": "2026"}}
+                for survey_id in survey_ids
+            })
+            failed = [r for r in results if not r["success"]]
+        """
+        if position not in _POSITIONS:
+            raise ValueError("position must be 'start' or 'end'")
 
-        # Update the flow
-        update_response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}/flow',
-            headers=self.headers,
-            json=update_payload
-        )
+        def apply(job):
+            survey_id, fields = job
+            try:
+                self.set_embedded_data_fields(survey_id, fields, position)
+            except Exception as error:
+                return {'survey_id': survey_id, 'success': False, 'error': error}
+            return {'survey_id': survey_id, 'success': True, 'error': None}
 
-        if update_response.status_code == 200:
-            return {
-                "fields": list(fields.keys()),
-                "count": len(fields),
-                "position": position,
-                "success": True
-            }
-        else:
-            raise Exception(f"Failed to set embedded data fields: {update_response.text}")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(apply, survey_fields.items()))
 
     def get_embedded_data(self, survey_id: str) -> List[Dict[str, Any]]:
         """
@@ -371,19 +381,13 @@ class EmbeddedDataMixin:
         Raises:
             Exception: If the API call fails
         """
-        flow_response = requests.get(
-            f'{self.base_url}/survey-definitions/{survey_id}/flow',
-            headers=self.headers
-        )
-
-        if flow_response.status_code != 200:
-            raise Exception(f"Failed to get survey flow: {flow_response.text}")
-
-        current_flow = flow_response.json()['result']
-        flow_list = current_flow.get('Flow', [])
+        return self._embedded_data_in_flow(self.get_survey_flow(survey_id))
 
+    @staticmethod
+    def _embedded_data_in_flow(current_flow: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Collect the fields of every top-level EmbeddedData element."""
         embedded_data_fields = []
-        for element in flow_list:
+        for element in current_flow.get('Flow', []):
             if element.get('Type') == 'EmbeddedData':
                 embedded_data_fields.extend(element.get('EmbeddedData', []))
 
@@ -407,30 +411,42 @@ class EmbeddedDataMixin:
         Raises:
             Exception: If the API call fails
         """
-        flow_response = requests.get(
-            f'{self.base_url}/survey-definitions/{survey_id}/flow',
-            headers=self.headers
-        )
+        with _FlowTransaction(self, survey_id, op="delete embedded data") as transaction:
+            transaction.delete_field(field_name)
+
+        return True
 
-        if flow_response.status_code != 200:
-            raise Exception(f"Failed to get survey flow: {flow_response.text}")
+    @staticmethod
+    def _flow_without_embedded_data(
+        current_flow: Dict[str, Any],
+        field_name: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Remove a field from the first EmbeddedData element that defines it.
 
-        current_flow = flow_response.json()['result']
+        Returns:
+            The flow update payload, and the EmbeddedData element it changed
+
+        Raises:
+            Exception: If no EmbeddedData element defines the field
+        """
         flow_list = current_flow.get('Flow', [])
 
-        field_found = False
+        changed_element = None
         for element in flow_list:
             if element.get('Type') == 'EmbeddedData':
                 existing_fields = element.get('EmbeddedData', [])
-                new_fields = [
-                    f for f in existing_fields if f.get('Field') != field_name
+                matches = [
+                    i for i, f in enumerate(existing_fields) if f.get('Field') == field_name
                 ]
-                if len(new_fields) != len(existing_fields):
-                    field_found = True
-                    element['EmbeddedData'] = new_fields
+                if matches:
+                    # Delete in place (last first, so earlier indices stay valid)
+                    for i in reversed(matches):
+                        del existing_fields[i]
+                    changed_element = element
                     break
 
-        if not field_found:
+        if changed_element is None:
             raise Exception(f"Embedded data field '{field_name}' not found")
 
         # Build the update payload with only required fields
@@ -440,17 +456,32 @@ class EmbeddedDataMixin:
             "Flow": flow_list,
             "Properties": current_flow.get("Properties", {"Count": len(flow_list)})
         }
+        return update_payload, changed_element
 
-        update_response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}/flow',
-            headers=self.headers,
-            json=update_payload
-        )
+    def embedded_data_transaction(self, survey_id: str) -> "_FlowTransaction":
+        """
+        Group several embedded data edits into a single flow update.
 
-        if update_response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to delete embedded data: {update_response.text}")
+        Each set_embedded_data / delete_embedded_data call costs a flow PUT.
+        Inside a transaction, edits are applied to one in-memory copy of the
+        flow (fetched on the first edit) and written back with one PUT when
+        the with block exits. If the block raises, nothing is written.
+
+        Args:
+            survey_id: The survey ID
+
+        Returns:
+            A context manager with set_field(), set_fields() and
+            delete_field() methods (same arguments as set_embedded_data,
+            set_embedded_data_fields and delete_embedded_data, minus survey_id)
+
+        Example:
+            >>> with api.embedded_data_transaction(survey_id) as tx:
+            ...     tx.set_field("condition", value="A")
+            ...     tx.set_fields({"score": {"type": "number"}}, position="end")
+            ...     tx.delete_field("old_field")
+        """
+        return _FlowTransaction(self, survey_id)
 
     def add_randomizer(
         self,
@@ -484,28 +515,41 @@ class EmbeddedDataMixin:
         """
         if not elements:
             raise ValueError("At least one element is required")
+        for elem in elements:
+            if not isinstance(elem, (str, dict)):
+                raise ValueError(
+                    f"Each element must be a block ID string or a dict, got {type(elem)}"
+                )
+        if not 1 <= subset <= len(elements):
+            raise ValueError(
+                f"subset must be between 1 and the number of elements ({len(elements)})"
+            )
+        if position is not None and position < 0:
+            raise ValueError("position must be a non-negative index")
 
         # Get current flow
         current_flow = self.get_survey_flow(survey_id)
         flow_list = current_flow.get("Flow", [])
 
-        # Build inner flow elements
+        # Build inner flow elements, numbered after every existing FlowID
         inner_flow = []
         block_ids_to_remove = set()
+        next_id = self._max_flow_id([current_flow]) + 1
 
         for elem in elements:
             if isinstance(elem, str):
                 # Block ID string -> Standard block element
-                fid = self._get_next_flow_id(flow_list + inner_flow)
                 inner_flow.append({
                     "Type": "Standard",
                     "ID": elem,
-                    "FlowID": fid,
+                    "FlowID": f"FL_{next_id}",
                 })
+                next_id += 1
                 block_ids_to_remove.add(elem)
-            elif isinstance(elem, dict):
+            else:
                 # Dict of embedded data fields -> EmbeddedData element
-                fid = self._get_next_flow_id(flow_list + inner_flow)
+                fid = f"FL_{next_id}"
+                next_id += 1
                 ed_items = []
                 for field_name, value in elem.items():
                     ed_items.append({
@@ -520,13 +564,9 @@ class EmbeddedDataMixin:
                     "FlowID": fid,
                     "EmbeddedData": ed_items,
                 })
-            else:
-                raise ValueError(
-                    f"Each element must be a block ID string or a dict, got {type(elem)}"
-                )
 
         # Build randomizer element
-        randomizer_fid = self._get_next_flow_id(flow_list + inner_flow)
+        randomizer_fid = f"FL_{next_id}"
         randomizer = {
             "Type": "BlockRandomizer",
             "FlowID": randomizer_fid,
@@ -562,26 +602,19 @@ class EmbeddedDataMixin:
             "Type": current_flow.get("Type", "Root"),
             "Flow": flow_list,
             "Properties": {
-                "Count": self._count_flow_elements(flow_list) + 1
+                "Count": next_id
             },
         }
 
-        resp = requests.put(
-            f"{self.base_url}/survey-definitions/{survey_id}/flow",
-            headers=self.headers,
-            json=update_payload,
-        )
+        self._put_survey_flow(survey_id, update_payload, op="add randomizer")
 
-        if resp.status_code == 200:
-            return {
-                "FlowID": randomizer_fid,
-                "SubSet": subset,
-                "EvenPresentation": even_presentation,
-                "element_count": len(elements),
-                "success": True,
-            }
-        else:
-            raise Exception(f"Failed to add randomizer: {resp.text}")
+        return {
+            "FlowID": randomizer_fid,
+            "SubSet": subset,
+            "EvenPresentation": even_presentation,
+            "element_count": len(elements),
+            "success": True,
+        }
 
     def get_survey_url_with_embedded_data(
         self,
@@ -619,5 +652,139 @@ class EmbeddedDataMixin:
         if not embedded_data:
             return base_url
 
-        query_string = urlencode(embedded_data)
+        # Same output as urlencode(), minus its per-call generic handling
+        query_string = "&".join(
+            f"{_quote_query_value(key)}={_quote_query_value(value)}"
+            for key, value in embedded_data.items()
+        )
         return f"{base_url}?{query_string}"
+
+    def compile_survey_url_template(
+        self,
+        survey_id: str,
+        field_names: List[str]
+    ) -> Callable[[Dict[str, Any]], str]:
+        """
+        Build a fast URL generator for a fixed set of embedded data fields.
+
+        Use this instead of get_survey_url_with_embedded_data when generating
+        many URLs with the same fields (e.g. a mail merge over 10k rows). The
+        base URL and the encoded field names are prepared once; each call
+        only percent-encodes the values (spaces become %20).
+
+        Args:
+            survey_id: The survey ID
+            field_names: The embedded data fields, in query string order
+
+        Returns:
+            A function taking a dict with (at least) every field in
+            field_names and returning the personalized survey URL
+
+        Example:
+            >>> make_url = api.compile_survey_url_template(survey_id, ["user_id", "name"])
+            >>> urls = [make_url(row) for row in rows]
+        """
+        base_url = f"https://{self.data_center}/jfe/form/{survey_id}"
+        if not field_names:
+            return lambda embedded_data: base_url
+
+        template = base_url + "?" + "&".join(
+            quote(name, safe='') + "={}"
+            for name in field_names
+        )
+        field_names = tuple(field_names)
+
+        def survey_url(embedded_data: Dict[str, Any]) -> str:
+            return template.format(*(
+                quote(value if isinstance(value, str) else str(value), safe='')
+                for value in map(embedded_data.__getitem__, field_names)
+            ))
+
+        return survey_url
+
+
+class _FlowTransaction:
+    """
+    Embedded data edits to one survey flow, written back with a single PUT.
+
+    Returned by EmbeddedDataMixin.embedded_data_transaction(). Unless the
+    caller already knows the flow and passes it in, it is fetched lazily on
+    the first edit, so invalid arguments fail before any request is made.
+    If the edits leave the flow as it was (e.g. setting a field to its
+    current configuration), nothing is sent.
+    """
+
+    __slots__ = ('_api', 'survey_id', '_op', '_flow', '_original', '_changed')
+
+    def __init__(
+        self,
+        api: EmbeddedDataMixin,
+        survey_id: str,
+        op: str = "update embedded data",
+        flow: Optional[Dict[str, Any]] = None
+    ):
+        self._api = api
+        self.survey_id = survey_id
+        self._op = op
+        self._flow: Optional[Dict[str, Any]] = flow
+        self._original: Optional[bytes] = None if flow is None else dumps(flow.get('Flow', []))
+        # The element each edit changed (None when it inserted a new one)
+        self._changed: List[Optional[Dict[str, Any]]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+
+    def _current_flow(self) -> Dict[str, Any]:
+        if self._flow is None:
+            self._flow = self._api.get_survey_flow(self.survey_id)
+            self._original = dumps(self._flow.get('Flow', []))
+        return self._flow
+
+    def set_field(
+        self,
+        field_name: str,
+        field_type: str = "text",
+        value: Optional[str] = None,
+        position: str = "start"
+    ) -> None:
+        """Configure one field (see EmbeddedDataMixin.set_embedded_data)."""
+        field_config = {"type": field_type}
+        if value is not None:
+            field_config["value"] = value
+        self.set_fields({field_name: field_config}, position)
+
+    def set_fields(self, fields: Dict[str, Dict[str, Any]], position: str = "start") -> None:
+        """Configure several fields (see EmbeddedDataMixin.set_embedded_data_fields)."""
+        if position not in _POSITIONS:
+            raise ValueError("position must be 'start' or 'end'")
+        items = EmbeddedDataMixin._embedded_data_items(fields)
+        self._flow, changed_element = EmbeddedDataMixin._flow_with_embedded_data(
+            self._current_flow(), items, position
+        )
+        self._changed.append(changed_element)
+
+    def delete_field(self, field_name: str) -> None:
+        """Delete a field (see EmbeddedDataMixin.delete_embedded_data)."""
+        self._flow, changed_element = EmbeddedDataMixin._flow_without_embedded_data(
+            self._current_flow(), field_name
+        )
+        self._changed.append(changed_element)
+
+    def commit(self) -> None:
+        """Write the pending edits back to the survey (a no-op if there are none)."""
+        if not self._changed:
+            return
+        flow_bytes = dumps(self._flow['Flow'])
+        if flow_bytes != self._original:
+            # Send just the element when every edit touched the same existing one
+            first = self._changed[0]
+            only_element = first if all(c is first for c in self._changed) else None
+            self._api._put_survey_flow(
+                self.survey_id, self._flow, op=self._op, changed_element=only_element
+            )
+            self._original = flow_bytes
+        self._changed = []
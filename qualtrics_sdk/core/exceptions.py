@@ -0,0 +1,47 @@
+"""
+Exceptions
+Error types raised by the Qualtrics SDK
+"""
+
+from typing import Any, Optional
+
+
+class QualtricsAPIError(Exception):
+    """
+    Raised when the Qualtrics API returns a non-success status.
+
+    Subclasses Exception so existing ``except Exception`` handlers keep
+    working; the operation, status code and response body are available
+    as attributes for callers that need to branch on them.
+
+    The response body is only decoded when ``body`` is read or the error
+    is formatted, so callers that just check ``status_code`` never pay
+    for a large error payload.
+
+    Attributes:
+        op: Short description of the failed operation (e.g. "get survey")
+        status_code: HTTP status code returned by the API
+        response: The failed response (requests or httpx)
+    """
+
+    def __init__(self, op: str, response: Any):
+        self.op = op
+        self.status_code = response.status_code
+        self.response = response
+        super().__init__(op, response)
+
+    @property
+    def reason(self) -> Optional[str]:
+        """HTTP reason phrase (e.g. "Bad Request")."""
+        return (
+            getattr(self.response, 'reason', None)
+            or getattr(self.response, 'reason_phrase', None)
+        )
+
+    @property
+    def body(self) -> str:
+        """Raw response body text, decoded on first access."""
+        return self.response.text
+
+    def __str__(self) -> str:
+        return f"Failed to {self.op}: {self.body}"
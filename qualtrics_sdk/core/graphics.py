@@ -14,6 +14,8 @@ from urllib.parse import urlparse
 class GraphicsMixin:
     """Mixin providing graphics/image upload and management."""
 
+    __slots__ = ()
+
     def _get_library_id(self) -> str:
         """
         Get the user's personal library ID (UR_xxxx).
@@ -21,13 +23,7 @@ class GraphicsMixin:
         Returns:
             The library ID string
         """
-        response = requests.get(
-            f"{self.base_url}/whoami",
-            headers=self.headers,
-        )
-        if response.status_code != 200:
-            raise Exception(f"Failed to get user info: {response.text}")
-        return response.json()["result"]["userId"]
+        return self._request("GET", "/whoami", op="get user info")["userId"]
 
     def upload_graphic(
         self,
@@ -58,7 +54,8 @@ class GraphicsMixin:
         is_url = parsed.scheme in ("http", "https")
 
         if is_url:
-            # Download to a temp file first
+            # Download to a temp file first (outside the API session so the
+            # API token is never sent to a third-party host)
             dl = requests.get(image_source, timeout=30)
             if dl.status_code != 200:
                 raise Exception(
@@ -87,9 +84,9 @@ class GraphicsMixin:
         }
         content_type = content_types.get(ext, "image/png")
 
-        # Upload via multipart form
-        upload_headers = {"X-API-TOKEN": self.api_token}
-        url = f"{self.base_url}/libraries/{library_id}/graphics"
+        # Upload via multipart form; drop the session's JSON content type so
+        # requests can set the multipart boundary itself
+        upload_headers = {"Content-Type": None}
         params = {}
         if folder:
             params["folder"] = folder
@@ -97,18 +94,16 @@ class GraphicsMixin:
         try:
             with open(local_path, "rb") as f:
                 files = {"file": (filename, f, content_type)}
-                response = requests.post(
-                    url, headers=upload_headers, files=files, params=params
+                result = self._request(
+                    "POST", f"/libraries/{library_id}/graphics",
+                    headers=upload_headers, files=files, params=params,
+                    op="upload graphic"
                 )
         finally:
             # Clean up temp file if we created one
             if is_url:
                 os.unlink(local_path)
 
-        if response.status_code != 200:
-            raise Exception(f"Failed to upload graphic: {response.text}")
-
-        result = response.json()["result"]
         graphic_id = result["id"]
 
         # Build the Qualtrics-hosted URL
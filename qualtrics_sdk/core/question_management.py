@@ -3,13 +3,14 @@ Question Management Mixin
 Handles updating, deleting, and retrieving existing questions
 """
 
-import requests
 from typing import Dict, List, Any
 
 
 class QuestionManagementMixin:
     """Mixin providing question management operations"""
 
+    __slots__ = ()
+
     def update_question(
         self, survey_id: str, question_id: str,
         question_data: Dict[str, Any]
@@ -25,17 +26,11 @@ class QuestionManagementMixin:
         Returns:
             True if successful
         """
-        response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}/questions/{question_id}',
-            headers=self.headers,
-            json=question_data
+        return self._request(
+            'PUT', f'/survey-definitions/{survey_id}/questions/{question_id}',
+            json=question_data, op="update question", parse_result=False
         )
 
-        if response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to update question: {response.text}")
-
     def update_question_text(
         self, survey_id: str, question_id: str,
         new_text: str
@@ -67,16 +62,11 @@ class QuestionManagementMixin:
         Returns:
             True if successful
         """
-        response = requests.delete(
-            f'{self.base_url}/survey-definitions/{survey_id}/questions/{question_id}',
-            headers=self.headers
+        return self._request(
+            'DELETE', f'/survey-definitions/{survey_id}/questions/{question_id}',
+            op="delete question", parse_result=False
         )
 
-        if response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to delete question: {response.text}")
-
     def get_question(self, survey_id: str, question_id: str) -> Dict[str, Any]:
         """
         Get details of a specific question
@@ -88,15 +78,10 @@ class QuestionManagementMixin:
         Returns:
             Dictionary with question details
         """
-        response = requests.get(
-            f'{self.base_url}/survey-definitions/{survey_id}/questions/{question_id}',
-            headers=self.headers
-        )
-
-        if response.status_code == 200:
-            return response.json()['result']
-        else:
-            raise Exception(f"Failed to get question: {response.text}")
+        return self._cached_get(
+            f'/survey-definitions/{survey_id}/questions/{question_id}',
+            "get question"
+        )['result']
 
     def get_survey_questions(self, survey_id: str) -> List[Dict[str, Any]]:
         """
@@ -109,16 +94,21 @@ class QuestionManagementMixin:
             List of question dictionaries
         """
         survey = self.get_survey(survey_id)
+        # The survey definition already embeds every question, so use it
+        # instead of issuing one GET per question
+        survey_questions = survey.get('Questions', {})
         questions = []
 
-        # Navigate through blocks to get questions
+        # Navigate through blocks to keep questions in block order
         if 'Blocks' in survey:
             for block_id, block in survey['Blocks'].items():
                 if 'BlockElements' in block:
                     for element in block['BlockElements']:
                         if element['Type'] == 'Question':
                             question_id = element['QuestionID']
-                            question = self.get_question(survey_id, question_id)
+                            question = survey_questions.get(question_id)
+                            if question is None:
+                                question = self.get_question(survey_id, question_id)
                             questions.append(question)
 
         return questions
@@ -178,13 +168,7 @@ class QuestionManagementMixin:
         if current_question.get('DisplayLogic'):
             question_data['DisplayLogic'] = current_question['DisplayLogic']
 
-        response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}/questions/{question_id}',
-            headers=self.headers,
-            json=question_data
+        return self._request(
+            'PUT', f'/survey-definitions/{survey_id}/questions/{question_id}',
+            json=question_data, op="add page break", parse_result=False
         )
-
-        if response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to add page break: {response.text}")
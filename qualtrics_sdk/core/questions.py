@@ -4,13 +4,59 @@ Handles creation of all question types
 """
 
 import re
-import requests
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+
+_TAG_RE = re.compile(r'[^a-zA-Z0-9]')
+
+# Static Configuration blocks shared by the question builders; each payload
+# gets its own shallow copy (see _question_payload) so callers can never
+# mutate the templates
+_DEFAULT_CONFIGURATION = {"QuestionDescriptionOption": "UseText"}
+_SLIDER_CONFIGURATION = {
+    "QuestionDescriptionOption": "UseText",
+    "GridLines": 0,
+    "NumDecimals": "0",
+    "ShowValue": True
+}
+
+# Fixed part of each question type's payload, keyed like QUESTION_CREATORS.
+# Selector is the default and may be overridden per call.
+_QUESTION_SHAPES = {
+    'mc': {"QuestionType": "MC", "Selector": "SAVR", "SubSelector": "TX",
+           "Configuration": _DEFAULT_CONFIGURATION},
+    'text': {"QuestionType": "TE", "Selector": "SL",
+             "Configuration": _DEFAULT_CONFIGURATION},
+    'matrix': {"QuestionType": "Matrix", "Selector": "Likert", "SubSelector": "SingleAnswer",
+               "Configuration": _DEFAULT_CONFIGURATION},
+    'slider': {"QuestionType": "Slider", "Selector": "HSLIDER",
+               "Configuration": _SLIDER_CONFIGURATION},
+    'rank_order': {"QuestionType": "RO", "Selector": "DND", "SubSelector": "TX",
+                   "Configuration": _DEFAULT_CONFIGURATION},
+    'nps': {"QuestionType": "MC", "Selector": "NPS",
+            "Configuration": _DEFAULT_CONFIGURATION},
+    'descriptive': {"QuestionType": "DB", "Selector": "TB", "SubSelector": "TX",
+                    "Configuration": _DEFAULT_CONFIGURATION},
+}
 
 
 class QuestionMixin:
     """Mixin providing question creation methods for all question types"""
 
+    __slots__ = ()
+
+    # Spec "type" -> creation method, used by create_questions_bulk
+    QUESTION_CREATORS = {
+        'mc': 'create_multiple_choice_question',
+        'text': 'create_text_entry_question',
+        'matrix': 'create_matrix_question',
+        'slider': 'create_slider_question',
+        'rank_order': 'create_rank_order_question',
+        'nps': 'create_nps_question',
+        'descriptive': 'create_descriptive_text',
+    }
+
     def _send_question(
         self,
         survey_id: str,
@@ -35,22 +81,41 @@ class QuestionMixin:
             Dictionary with question details including QuestionID
         """
         if question_id:
-            url = f"{self.base_url}/survey-definitions/{survey_id}/questions/{question_id}"
-            response = requests.put(url, headers=self.headers, json=question_data)
-        else:
-            url = f"{self.base_url}/survey-definitions/{survey_id}/questions"
-            params = {"blockId": block_id} if block_id else None
-            response = requests.post(url, headers=self.headers, json=question_data, params=params)
-
-        if response.status_code == 200:
-            body = response.json()
-            if question_id:
-                # PUT returns no result key — just confirm success
-                return {"QuestionID": question_id}
-            return body["result"]
-        else:
-            action = "update" if question_id else "create"
-            raise Exception(f"Failed to {action} question: {response.text}")
+            # PUT returns no result key — just confirm success
+            self._request(
+                "PUT", f"/survey-definitions/{survey_id}/questions/{question_id}",
+                json=question_data, op="update question", parse_result=False
+            )
+            return {"QuestionID": question_id}
+
+        params = {"blockId": block_id} if block_id else None
+        return self._request(
+            "POST", f"/survey-definitions/{survey_id}/questions",
+            json=question_data, params=params, op="create question"
+        )
+
+    def _question_payload(
+        self, kind: str, question_text: str, **fields: Any
+    ) -> Dict[str, Any]:
+        """
+        Build a question payload from its shape in _QUESTION_SHAPES.
+
+        Args:
+            kind: Question kind (a key of QUESTION_CREATORS)
+            question_text: The question text
+            **fields: Additional or overriding payload keys (e.g. Choices)
+
+        Returns:
+            Question payload ready for _send_question
+        """
+        shape = _QUESTION_SHAPES[kind]
+        payload = {
+            "QuestionText": question_text,
+            **shape,
+            "Configuration": dict(shape["Configuration"]),
+        }
+        payload.update(fields)
+        return payload
 
     def _generate_data_export_tag(self, question_text: str) -> str:
         """
@@ -62,7 +127,7 @@ class QuestionMixin:
         Returns:
             Sanitized export tag
         """
-        return re.sub(r'[^a-zA-Z0-9]', '_', question_text[:30])
+        return _TAG_RE.sub('_', question_text[:30])
 
     def create_multiple_choice_question(
         self, survey_id: str, question_text: str,
@@ -92,9 +157,7 @@ class QuestionMixin:
             Dictionary with question details including QuestionID
         """
         # Build choices dictionary
-        choices_dict = {}
-        for i, choice in enumerate(choices, start=1):
-            choices_dict[str(i)] = {"Display": choice}
+        choices_dict = {str(i): {"Display": choice} for i, choice in enumerate(choices, start=1)}
 
         # Adjust selector for multiple answer questions
         if allow_multiple:
@@ -106,17 +169,12 @@ class QuestionMixin:
         # Build choice order (list of choice IDs in order)
         choice_order = [str(i) for i in range(1, len(choices) + 1)]
 
-        question_data = {
-            "QuestionText": question_text,
-            "QuestionType": "MC",
-            "Selector": selector,
-            "SubSelector": "TX",
-            "Choices": choices_dict,
-            "ChoiceOrder": choice_order,
-            "Configuration": {
-                "QuestionDescriptionOption": "UseText"
-            }
-        }
+        question_data = self._question_payload(
+            'mc', question_text,
+            Selector=selector,
+            Choices=choices_dict,
+            ChoiceOrder=choice_order,
+        )
 
         return self._send_question(survey_id, question_data, question_id, block_id)
 
@@ -145,15 +203,11 @@ class QuestionMixin:
         if data_export_tag is None:
             data_export_tag = self._generate_data_export_tag(question_text)
 
-        question_data = {
-            "QuestionText": question_text,
-            "DataExportTag": data_export_tag,
-            "QuestionType": "TE",
-            "Selector": text_type,
-            "Configuration": {
-                "QuestionDescriptionOption": "UseText"
-            }
-        }
+        question_data = self._question_payload(
+            'text', question_text,
+            DataExportTag=data_export_tag,
+            Selector=text_type,
+        )
 
         return self._send_question(survey_id, question_data, question_id, block_id)
 
@@ -178,26 +232,18 @@ class QuestionMixin:
             Dictionary with question details
         """
         # Build statements dictionary
-        statements_dict = {}
-        for i, statement in enumerate(statements, start=1):
-            statements_dict[str(i)] = {"Display": statement}
+        statements_dict = {
+            str(i): {"Display": statement} for i, statement in enumerate(statements, start=1)
+        }
 
         # Build scale points dictionary
-        answers_dict = {}
-        for i, point in enumerate(scale_points, start=1):
-            answers_dict[str(i)] = {"Display": point}
+        answers_dict = {str(i): {"Display": point} for i, point in enumerate(scale_points, start=1)}
 
-        question_data = {
-            "QuestionText": question_text,
-            "QuestionType": "Matrix",
-            "Selector": "Likert",
-            "SubSelector": "SingleAnswer",
-            "Choices": statements_dict,
-            "Answers": answers_dict,
-            "Configuration": {
-                "QuestionDescriptionOption": "UseText"
-            }
-        }
+        question_data = self._question_payload(
+            'matrix', question_text,
+            Choices=statements_dict,
+            Answers=answers_dict,
+        )
 
         return self._send_question(survey_id, question_data, question_id, block_id)
 
@@ -229,24 +275,12 @@ class QuestionMixin:
         if data_export_tag is None:
             data_export_tag = self._generate_data_export_tag(question_text)
 
-        question_data = {
-            "QuestionText": question_text,
-            "DataExportTag": data_export_tag,
-            "QuestionType": "Slider",
-            "Selector": "HSLIDER",
-            "Configuration": {
-                "QuestionDescriptionOption": "UseText",
-                "GridLines": 0,
-                "NumDecimals": "0",
-                "ShowValue": True
-            },
-            "Choices": {
-                "1": {
-                    "Display": question_text
-                }
-            },
-            "ChoiceOrder": [1]
-        }
+        question_data = self._question_payload(
+            'slider', question_text,
+            DataExportTag=data_export_tag,
+            Choices={"1": {"Display": question_text}},
+            ChoiceOrder=[1],
+        )
 
         if left_label or right_label:
             question_data["Labels"] = {}
@@ -281,21 +315,13 @@ class QuestionMixin:
         if data_export_tag is None:
             data_export_tag = self._generate_data_export_tag(question_text)
 
-        choices_dict = {}
-        for i, item in enumerate(items, start=1):
-            choices_dict[str(i)] = {"Display": item}
+        choices_dict = {str(i): {"Display": item} for i, item in enumerate(items, start=1)}
 
-        question_data = {
-            "QuestionText": question_text,
-            "DataExportTag": data_export_tag,
-            "QuestionType": "RO",
-            "Selector": "DND",
-            "SubSelector": "TX",
-            "Choices": choices_dict,
-            "Configuration": {
-                "QuestionDescriptionOption": "UseText"
-            }
-        }
+        question_data = self._question_payload(
+            'rank_order', question_text,
+            DataExportTag=data_export_tag,
+            Choices=choices_dict,
+        )
 
         return self._send_question(survey_id, question_data, question_id, block_id)
 
@@ -333,25 +359,18 @@ class QuestionMixin:
             data_export_tag = self._generate_data_export_tag(question_text)
 
         # NPS is a 0-10 scale
-        choices_dict = {}
-        for i in range(11):
-            choices_dict[str(i)] = {"Display": str(i)}
-
-        question_data = {
-            "QuestionText": question_text,
-            "DataExportTag": data_export_tag,
-            "QuestionType": "MC",
-            "Selector": "NPS",
-            "Choices": choices_dict,
-            "ChoiceOrder": [str(i) for i in range(11)],
-            "Configuration": {
-                "QuestionDescriptionOption": "UseText"
-            },
-            "ColumnLabels": [
+        choices_dict = {str(i): {"Display": str(i)} for i in range(11)}
+
+        question_data = self._question_payload(
+            'nps', question_text,
+            DataExportTag=data_export_tag,
+            Choices=choices_dict,
+            ChoiceOrder=[str(i) for i in range(11)],
+            ColumnLabels=[
                 {"Display": left_label, "IsLabelDefault": False},
                 {"Display": right_label, "IsLabelDefault": False},
             ],
-        }
+        )
 
         return self._send_question(survey_id, question_data, question_id, block_id)
 
@@ -372,14 +391,74 @@ class QuestionMixin:
         Returns:
             Dictionary with question details
         """
-        question_data = {
-            "QuestionText": text,
-            "QuestionType": "DB",
-            "Selector": "TB",
-            "SubSelector": "TX",
-            "Configuration": {
-                "QuestionDescriptionOption": "UseText"
-            }
-        }
+        question_data = self._question_payload('descriptive', text)
 
         return self._send_question(survey_id, question_data, question_id, block_id)
+
+    def _resolve_question_specs(
+        self, specs: List[Dict[str, Any]]
+    ) -> List[Tuple[Callable[..., Any], Dict[str, Any]]]:
+        """
+        Map bulk question specs to (create method, kwargs) pairs.
+
+        Validates every spec up front so a bad entry fails before any
+        request is sent.
+
+        Args:
+            specs: List of question specs with a "type" key
+
+        Returns:
+            List of (bound create_* method, keyword arguments) tuples
+        """
+        calls = []
+        for i, spec in enumerate(specs):
+            kwargs = dict(spec)
+            question_type = kwargs.pop('type', None)
+            if question_type not in self.QUESTION_CREATORS:
+                raise ValueError(
+                    f"Invalid question type '{question_type}' in spec {i}. "
+                    f"Valid types: {list(self.QUESTION_CREATORS.keys())}"
+                )
+            calls.append((getattr(self, self.QUESTION_CREATORS[question_type]), kwargs))
+        return calls
+
+    def create_questions_bulk(
+        self, survey_id: str,
+        specs: List[Dict[str, Any]],
+        max_workers: int = 16,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create many questions concurrently over the shared session.
+
+        Each spec names a question type (see QUESTION_CREATORS) plus the keyword
+        arguments for the matching create_* method. Requests are dispatched from
+        a thread pool, so N questions cost roughly N / max_workers round trips
+        instead of N.
+
+        Note that Qualtrics appends new questions in the order the requests
+        arrive, so the on-survey order of questions sharing a block is not
+        guaranteed. Create them sequentially if block order matters.
+
+        Args:
+            survey_id: The survey ID
+            specs: List of question specs, e.g.
+                   {"type": "mc", "question_text": "Role?", "choices": ["A", "B"]}
+            max_workers: Maximum number of concurrent requests (default: 16)
+
+        Returns:
+            List of question details, in the same order as specs
+
+        Example:
+            api.create_questions_bulk(survey_id, [
+                {"type": "mc", "question_text": "Role?", "choices": ["Student", "Staff"]},
+                {"type": "text", "question_text": "Comments?", "text_type": "ML"},
+            ])
+        """
+        calls = self._resolve_question_specs(specs)
+        if not calls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda call: call[0](survey_id, **call[1]), calls
+            ))
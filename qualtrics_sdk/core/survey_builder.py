@@ -0,0 +1,147 @@
+"""
+Survey Builder
+Assembles a complete survey definition locally for one-request import
+"""
+
+from typing import Dict, List, Any, Optional
+
+from .questions import QuestionMixin
+
+
+class SurveyBuilder(QuestionMixin):
+    """
+    Build a whole survey offline and import it with a single request.
+
+    Every create_* method from QuestionMixin works here and produces the same
+    question payload it would send to the API, but the question is recorded
+    locally instead (the survey_id argument is ignored). build() returns a
+    QSF definition for QualtricsAPI.create_survey_from_definition(), so a
+    200-question survey costs one round trip instead of 200.
+
+    Usage:
+        >>> builder = SurveyBuilder("My Survey")
+        >>> builder.add("mc", question_text="Role?", choices=["Student", "Staff"])
+        >>> block = builder.add_block("Feedback")
+        >>> builder.add("text", question_text="Comments?", text_type="ML", block_id=block)
+        >>> survey = api.create_survey_from_definition(builder.build())
+    """
+
+    __slots__ = ('survey_name', 'language', '_blocks', '_questions')
+
+    def __init__(self, survey_name: str, language: str = "EN"):
+        """
+        Start an empty survey definition with a default block.
+
+        Args:
+            survey_name: Name of the survey
+            language: Survey language (default: "EN")
+        """
+        self.survey_name = survey_name
+        self.language = language
+        self._blocks: List[Dict[str, Any]] = [{
+            "Type": "Default",
+            "Description": "Default Question Block",
+            "ID": "BL_1",
+            "BlockElements": [],
+        }]
+        self._questions: Dict[str, Dict[str, Any]] = {}
+
+    def add_block(self, description: str) -> str:
+        """
+        Add an empty standard block at the end of the survey.
+
+        Args:
+            description: Block name shown in the survey editor
+
+        Returns:
+            The new block ID, for the block_id argument of add()
+        """
+        block_id = f"BL_{len(self._blocks) + 1}"
+        self._blocks.append({
+            "Type": "Standard",
+            "Description": description,
+            "ID": block_id,
+            "BlockElements": [],
+        })
+        return block_id
+
+    def add(self, question_type: str, **kwargs: Any) -> str:
+        """
+        Add a question described like a create_questions_bulk spec.
+
+        Args:
+            question_type: A key of QUESTION_CREATORS (e.g. "mc", "matrix")
+            **kwargs: Arguments for the matching create_* method
+
+        Returns:
+            The QuestionID assigned to the new question
+        """
+        (create, kwargs), = self._resolve_question_specs([{"type": question_type, **kwargs}])
+        return create(None, **kwargs)["QuestionID"]
+
+    def _send_question(
+        self,
+        survey_id: Optional[str],
+        question_data: Dict[str, Any],
+        question_id: Optional[str] = None,
+        block_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Record a question payload instead of sending it.
+
+        Replacing an existing question_id swaps its payload in place; new
+        questions are appended to block_id or the default block.
+        """
+        if question_id and question_id in self._questions:
+            self._questions[question_id] = question_data
+            return {"QuestionID": question_id}
+
+        block = next((b for b in self._blocks if b["ID"] == block_id), None)
+        if block is None:
+            if block_id:
+                raise ValueError(f"Block '{block_id}' not found in builder")
+            block = self._blocks[0]
+
+        question_id = f"QID{len(self._questions) + 1}"
+        self._questions[question_id] = question_data
+        block["BlockElements"].append({"Type": "Question", "QuestionID": question_id})
+        return {"QuestionID": question_id}
+
+    def build(self) -> Dict[str, Any]:
+        """
+        Return the survey as a QSF definition.
+
+        Returns:
+            Dictionary with SurveyEntry and SurveyElements (blocks, flow and
+            one SQ element per question), ready for import
+        """
+        flow = [
+            {"Type": "Block" if block["Type"] == "Default" else "Standard",
+             "ID": block["ID"], "FlowID": f"FL_{i}"}
+            for i, block in enumerate(self._blocks, start=2)
+        ]
+
+        elements = [
+            {"Element": "BL", "PrimaryAttribute": "Survey Blocks",
+             "SecondaryAttribute": None, "Payload": self._blocks},
+            {"Element": "FL", "PrimaryAttribute": "Survey Flow",
+             "SecondaryAttribute": None,
+             "Payload": {"Type": "Root", "FlowID": "FL_1", "Flow": flow,
+                         "Properties": {"Count": len(flow) + 1}}},
+        ]
+        for n, (question_id, question) in enumerate(self._questions.items(), start=1):
+            payload = {"DataExportTag": f"Q{n}", **question, "QuestionID": question_id}
+            elements.append({
+                "Element": "SQ", "PrimaryAttribute": question_id,
+                "SecondaryAttribute": question["QuestionText"][:100],
+                "Payload": payload,
+            })
+
+        return {
+            "SurveyEntry": {
+                "SurveyName": self.survey_name,
+                "SurveyLanguage": self.language,
+                "SurveyStatus": "Inactive",
+            },
+            "SurveyElements": elements,
+        }
@@ -5,14 +5,23 @@ Handles all survey CRUD operations
 
 import inspect
 import os
-import requests
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Any, Optional
+
+from .embedded_data import _FlowTransaction
+from .exceptions import QualtricsAPIError
+from ..models import survey as survey_models
+from ..utils.serialization import dumps
+
+if TYPE_CHECKING:
+    from ..models.survey import SurveyDefinition
 
 
 class SurveyMixin:
     """Mixin providing survey CRUD operations"""
 
+    __slots__ = ()
+
     def create_survey(
         self,
         survey_name: str,
@@ -43,35 +52,106 @@ class SurveyMixin:
             "ProjectCategory": project_category
         }
 
-        response = requests.post(
-            f'{self.base_url}/survey-definitions',
-            headers=self.headers,
-            json=survey_data
+        result = self._request(
+            'POST', '/survey-definitions',
+            json=survey_data, op="create survey"
         )
 
-        if response.status_code != 200:
-            raise Exception(f"Failed to create survey: {response.text}")
+        if setup_defaults:
+            # A new survey's flow is just its default block, so the default
+            # embedded data can be written without fetching the flow first
+            flow = None
+            if result.get('DefaultBlockID'):
+                flow = {
+                    "FlowID": "FL_1",
+                    "Type": "Root",
+                    "Flow": [{"Type": "Block", "ID": result['DefaultBlockID'], "FlowID": "FL_2"}],
+                    "Properties": {"Count": 2},
+                }
+            self._apply_default_options(result['SurveyID'], flow)
+
+        return result
+
+    def create_survey_from_definition(
+        self,
+        definition: Dict[str, Any],
+        setup_defaults: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Create a survey, with all of its blocks and questions, in one request.
+
+        Imports a QSF definition, such as the one produced by
+        SurveyBuilder.build() or exported from Qualtrics. This is the fast
+        path for scripted surveys: the per-question create_* methods cost one
+        round trip each and are best kept for incremental edits.
 
-        result = response.json()['result']
+        Args:
+            definition: QSF dictionary with SurveyEntry and SurveyElements
+            setup_defaults: If True, apply classic template and default embedded
+                            data after import (default: True)
+
+        Returns:
+            Dictionary with survey details including SurveyID
+        """
+        survey_name = definition["SurveyEntry"]["SurveyName"]
+
+        # Multipart upload; drop the session's JSON content type so requests
+        # can set the boundary itself
+        result = self._request(
+            'POST', '/surveys',
+            headers={"Content-Type": None},
+            data={"name": survey_name},
+            files={"file": (
+                "survey.qsf", dumps(definition), "application/vnd.qualtrics.survey.qsf"
+            )},
+            op="import survey"
+        )
+        result["SurveyID"] = result["id"]
 
         if setup_defaults:
-            survey_id = result['SurveyID']
-            self._apply_default_options(survey_id)
+            self._apply_default_options(result["SurveyID"])
 
         return result
 
-    def _apply_default_options(self, survey_id: str) -> None:
-        """Apply default options to a newly created survey (classic template + embedded data)."""
+    def _apply_default_options(
+        self, survey_id: str, flow: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Apply default options to a newly created survey (classic template + embedded data).
+
+        Args:
+            survey_id: The survey ID
+            flow: The survey's flow as created, if known; the embedded data
+                  is then written without a flow GET. It is only used for
+                  this one update and never cached.
+        """
         self.set_survey_template(survey_id, "*2014")
 
         caller_path = self._get_caller_path()
         today = datetime.now().strftime("%Y-%m-%d")
 
-        self.set_embedded_data_fields(survey_id, {
+        fields = {
             "PROLIFIC_PID": {"type": "text"},
             "date_created": {"type": "text", "value": today},
             "created_by_script": {"type": "text", "value": caller_path},
-        })
+        }
+        if flow is None:
+            self.set_embedded_data_fields(survey_id, fields)
+            return
+
+        try:
+            with _FlowTransaction(
+                self, survey_id, op="set embedded data fields", flow=flow
+            ) as transaction:
+                transaction.set_fields(fields)
+        except QualtricsAPIError as error:
+            # The assumed flow was rejected; retry once against the real one
+            if not 400 <= error.status_code < 500:
+                raise
+            self.set_embedded_data_fields(survey_id, fields)
+        finally:
+            # Don't let the assumed flow serve later reads
+            self._drop_cached(f'/survey-definitions/{survey_id}/flow')
 
     @staticmethod
     def _get_caller_path() -> str:
@@ -92,16 +172,11 @@ class SurveyMixin:
         Returns:
             Dictionary with all survey options
         """
-        response = requests.get(
-            f'{self.base_url}/survey-definitions/{survey_id}/options',
-            headers=self.headers
+        return self._request(
+            'GET', f'/survey-definitions/{survey_id}/options',
+            op="get survey options"
         )
 
-        if response.status_code == 200:
-            return response.json()['result']
-        else:
-            raise Exception(f"Failed to get survey options: {response.text}")
-
     def update_survey_options(
         self, survey_id: str, updates: Dict[str, Any]
     ) -> bool:
@@ -118,17 +193,11 @@ class SurveyMixin:
         options = self.get_survey_options(survey_id)
         options.update(updates)
 
-        response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}/options',
-            headers=self.headers,
-            json=options
+        return self._request(
+            'PUT', f'/survey-definitions/{survey_id}/options',
+            json=options, op="update survey options", parse_result=False
         )
 
-        if response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to update survey options: {response.text}")
-
     def set_survey_template(
         self, survey_id: str, template_id: str = "*2014"
     ) -> bool:
@@ -205,15 +274,33 @@ class SurveyMixin:
         Returns:
             Dictionary with complete survey details
         """
-        response = requests.get(
-            f'{self.base_url}/survey-definitions/{survey_id}',
-            headers=self.headers
-        )
+        return self._cached_get(
+            f'/survey-definitions/{survey_id}', "get survey"
+        )['result']
+
+    def get_survey_typed(self, survey_id: str) -> "SurveyDefinition":
+        """
+        Get survey details as a validated, attribute-access object.
+
+        Uses the same cached definition as get_survey(), converted once into
+        msgspec structs so blocks and elements can be walked without repeated
+        dictionary lookups. Requires msgspec (``pip install qualtrics-sdk[typed]``).
+
+        Args:
+            survey_id: The survey ID
 
-        if response.status_code == 200:
-            return response.json()['result']
-        else:
-            raise Exception(f"Failed to get survey: {response.text}")
+        Returns:
+            SurveyDefinition with Blocks, Questions and iter_questions()
+        """
+        if survey_models.msgspec is None:
+            raise ImportError(
+                "get_survey_typed requires msgspec. "
+                "Install it with: pip install qualtrics-sdk[typed]"
+            )
+
+        return survey_models.msgspec.convert(
+            self.get_survey(survey_id), survey_models.SurveyDefinition
+        )
 
     def delete_survey(self, survey_id: str) -> bool:
         """
@@ -225,15 +312,28 @@ class SurveyMixin:
         Returns:
             True if successful
         """
-        response = requests.delete(
-            f'{self.base_url}/survey-definitions/{survey_id}',
-            headers=self.headers
+        return self._request(
+            'DELETE', f'/survey-definitions/{survey_id}',
+            op="delete survey", parse_result=False
         )
 
-        if response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to delete survey: {response.text}")
+    def iter_surveys(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all surveys in your account, one page at a time.
+
+        Follows the API's nextPage links lazily, so only the current page is
+        held in memory and the first surveys are available as soon as the
+        first page arrives. Pages are not cached.
+
+        Yields:
+            Survey dictionaries
+        """
+        path = '/surveys'
+        while path:
+            result = self._request('GET', path, op="list surveys")
+            yield from result['elements']
+            # nextPage is an absolute URL, which _request passes through
+            path = result.get('nextPage')
 
     def list_surveys(self) -> List[Dict[str, Any]]:
         """
@@ -242,15 +342,7 @@ class SurveyMixin:
         Returns:
             List of survey dictionaries
         """
-        response = requests.get(
-            f'{self.base_url}/surveys',
-            headers=self.headers
-        )
-
-        if response.status_code == 200:
-            return response.json()['result']['elements']
-        else:
-            raise Exception(f"Failed to list surveys: {response.text}")
+        return list(self.iter_surveys())
 
     def update_survey_name(self, survey_id: str, new_name: str) -> bool:
         """
@@ -267,17 +359,11 @@ class SurveyMixin:
             "SurveyName": new_name
         }
 
-        response = requests.put(
-            f'{self.base_url}/survey-definitions/{survey_id}',
-            headers=self.headers,
-            json=update_data
+        return self._request(
+            'PUT', f'/survey-definitions/{survey_id}',
+            json=update_data, op="update survey name", parse_result=False
         )
 
-        if response.status_code == 200:
-            return True
-        else:
-            raise Exception(f"Failed to update survey name: {response.text}")
-
     def get_survey_url(self, survey_id: str) -> str:
         """
         Get the public URL for a survey
@@ -0,0 +1,50 @@
+"""
+Survey Models
+Typed views of survey definitions, validated once with msgspec
+
+Requires msgspec (``pip install qualtrics-sdk[typed]``).
+"""
+
+from typing import Dict, List, Any, Optional
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without msgspec
+    msgspec = None
+
+
+if msgspec is not None:
+
+    class BlockElement(msgspec.Struct):
+        """An entry in a block: a question or a page break."""
+
+        Type: str
+        QuestionID: Optional[str] = None
+
+    class Block(msgspec.Struct):
+        """A survey block and its elements, in display order."""
+
+        Type: str = "Standard"
+        Description: str = ""
+        ID: Optional[str] = None
+        BlockElements: List[BlockElement] = []
+
+    class SurveyDefinition(msgspec.Struct):
+        """
+        The parts of a survey definition most callers walk.
+
+        Questions stay plain dictionaries so every question type round-trips
+        unchanged; unknown top-level keys are ignored.
+        """
+
+        SurveyID: str
+        SurveyName: str = ""
+        Blocks: Dict[str, Block] = {}
+        Questions: Dict[str, Dict[str, Any]] = {}
+
+        def iter_questions(self):
+            """Yield question dictionaries in block order."""
+            for block in self.Blocks.values():
+                for element in block.BlockElements:
+                    if element.Type == 'Question' and element.QuestionID in self.Questions:
+                        yield self.Questions[element.QuestionID]
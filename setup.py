@@ -42,6 +42,18 @@ setup(
         "python-dotenv>=0.19.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",
+            "brotli>=1.0.9",
+            "zstandard>=0.18.0",
+            "urllib3>=2.0",  # zstd decoding
+        ],
+        "async": [
+            "httpx[http2]>=0.23.0",
+        ],
+        "typed": [
+            "msgspec>=0.18.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
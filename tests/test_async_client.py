@@ -0,0 +1,165 @@
+"""
+Unit tests for AsyncQualtricsAPI
+
+Run with: pytest tests/test_async_client.py -v
+"""
+
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from qualtrics_sdk import AsyncQualtricsAPI, QualtricsAPIError
+
+
+def make_api(handler):
+    """Create an AsyncQualtricsAPI whose requests go to a mock transport"""
+    api = AsyncQualtricsAPI(api_token="test_token", data_center="test.qualtrics.com")
+    api._client = httpx.AsyncClient(
+        base_url=api.base_url,
+        headers=api.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return api
+
+
+class TestAsyncQuestions:
+    """Tests for async question creation"""
+
+    def test_create_question(self):
+        """create_* methods return awaitables that POST the payload"""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"result": {"QuestionID": "QID1"}})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.create_text_entry_question("SV_123", "Comments?")
+
+        result = asyncio.run(run())
+
+        assert result == {"QuestionID": "QID1"}
+        assert seen[0].method == "POST"
+        assert seen[0].url.path == "/API/v3/survey-definitions/SV_123/questions"
+        assert seen[0].headers["X-API-TOKEN"] == "test_token"
+        assert json.loads(seen[0].content)["QuestionType"] == "TE"
+
+    def test_bulk_preserves_order(self):
+        """create_questions_bulk returns results in spec order"""
+        def handler(request):
+            text = json.loads(request.content)["QuestionText"]
+            return httpx.Response(200, json={"result": {"QuestionID": text}})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.create_questions_bulk("SV_123", [
+                    {"type": "mc", "question_text": "Q_a", "choices": ["Yes", "No"]},
+                    {"type": "slider", "question_text": "Q_b"},
+                    {"type": "nps", "question_text": "Q_c"},
+                ], max_concurrency=2)
+
+        results = asyncio.run(run())
+
+        assert [r["QuestionID"] for r in results] == ["Q_a", "Q_b", "Q_c"]
+
+    def test_failure_raises_api_error(self):
+        """Non-200 responses raise QualtricsAPIError"""
+        def handler(request):
+            return httpx.Response(400, text="bad request")
+
+        async def run():
+            async with make_api(handler) as api:
+                await api.create_descriptive_text("SV_123", "Hello")
+
+        with pytest.raises(QualtricsAPIError) as exc_info:
+            asyncio.run(run())
+
+        assert exc_info.value.status_code == 400
+        assert "Failed to create question" in str(exc_info.value)
+
+
+class TestAsyncDisplayLogic:
+    """Tests for async display logic"""
+
+    def test_add_display_logic(self):
+        """add_display_logic awaits a GET of the question, then PUTs the logic"""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            if request.method == "GET":
+                return httpx.Response(200, json={"result": {
+                    "QuestionText": "Why?", "QuestionType": "TE", "Selector": "SL",
+                }})
+            return httpx.Response(200, json={"meta": {}})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.add_display_logic(
+                    "SV_123", "QID2", "QID1", "Selected",
+                    choice_locator="q://QID1/SelectableChoice/1",
+                )
+
+        assert asyncio.run(run()) is True
+        assert [r.method for r in seen] == ["GET", "PUT"]
+        payload = json.loads(seen[1].content)
+        assert payload["DisplayLogic"]["0"]["0"]["QuestionID"] == "QID1"
+
+    def test_batch_collects_failures(self):
+        """A failing rule is reported without aborting the others"""
+        def handler(request):
+            if request.method == "GET":
+                return httpx.Response(200, json={"result": {"QuestionText": "Q"}})
+            if request.url.path.endswith("QID3"):
+                return httpx.Response(500, text="boom")
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.add_display_logic_batch("SV_123", [
+                    {"question_id": "QID2", "source_question_id": "QID1", "operator": "Displayed"},
+                    {"question_id": "QID3", "source_question_id": "QID1", "operator": "Displayed"},
+                ])
+
+        results = asyncio.run(run())
+
+        assert [r["success"] for r in results] == [True, False]
+        assert results[1]["error"].status_code == 500
+
+
+class TestAsyncEmbeddedData:
+    """Tests for async embedded data"""
+
+    def test_bulk_updates_each_survey_flow(self):
+        """Each survey's flow is fetched and replaced with the new fields"""
+        puts = {}
+
+        def handler(request):
+            survey_id = request.url.path.split("/")[4]
+            if request.method == "GET":
+                if survey_id == "SV_bad":
+                    return httpx.Response(404, text="not found")
+                return httpx.Response(200, json={"result": {
+                    "FlowID": "FL_1", "Type": "Root",
+                    "Flow": [{"Type": "Block", "ID": "BL_1", "FlowID": "FL_2"}],
+                }})
+            puts[survey_id] = json.loads(request.content)
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with make_api(handler) as api:
+                return await api.set_embedded_data_fields_bulk({
+                    "SV_1": {"cond": {"value": "A"}},
+                    "SV_bad": {"cond": {"value": "B"}},
+                    "SV_2": {"cond": {"value": "C"}},
+                })
+
+        results = asyncio.run(run())
+
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[1]["error"].status_code == 404
+        assert puts["SV_2"]["Flow"][0]["EmbeddedData"][0]["Value"] == "C"
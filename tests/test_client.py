@@ -0,0 +1,411 @@
+"""
+Unit tests for the core API client (session handling)
+
+Run with: pytest tests/test_client.py -v
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock, PropertyMock, patch
+import requests
+from urllib3.exceptions import ConnectTimeoutError, ProtocolError
+
+from qualtrics_sdk import QualtricsAPI, QualtricsAPIError
+from qualtrics_sdk.utils.serialization import dumps, loads
+
+
+@pytest.fixture
+def api():
+    """Create a QualtricsAPI instance for testing"""
+    return QualtricsAPI(api_token="test_token", data_center="test.qualtrics.com")
+
+
+class TestSession:
+    """Tests for the shared requests.Session"""
+
+    def test_session_carries_auth_headers(self, api):
+        """The session should send the API token on every request"""
+        assert isinstance(api.session, requests.Session)
+        assert api.session.headers['X-API-TOKEN'] == "test_token"
+        assert api.session.headers['Content-Type'] == "application/json"
+
+    def test_instances_have_no_dict(self, api):
+        """Client state lives in __slots__, not a per-instance __dict__"""
+        assert not hasattr(api, '__dict__')
+        with pytest.raises(AttributeError):
+            api.not_an_attribute = 1
+
+    @patch('requests.Session.get')
+    def test_calls_reuse_session(self, mock_get):
+        """Consecutive calls should go through the same session"""
+        api = QualtricsAPI(api_token="t", data_center="test.qualtrics.com", cache_ttl=0)
+        mock_get.return_value = Mock(
+            status_code=200, json=lambda: {"result": {"elements": []}}
+        )
+
+        api.list_surveys()
+        api.list_surveys()
+
+        assert mock_get.call_count == 2
+
+    def test_context_manager_closes_session(self):
+        """Leaving the with-block should close the session"""
+        with patch('requests.Session.close') as mock_close:
+            with QualtricsAPI(api_token="t", data_center="test.qualtrics.com"):
+                pass
+        mock_close.assert_called_once()
+
+    @patch('requests.Session.request')
+    def test_json_body_is_pre_encoded(self, mock_request, api):
+        """json= payloads are sent as pre-encoded bytes"""
+        api.session.put(f"{api.base_url}/x", json={"QuestionText": "Hi", "ChoiceOrder": [1]})
+
+        kwargs = mock_request.call_args[1]
+        assert "json" not in kwargs
+        assert loads(kwargs["data"]) == {"QuestionText": "Hi", "ChoiceOrder": [1]}
+
+    def test_retry_policy(self, api):
+        """429/5xx are retried, but POSTs only on 429"""
+        retry = api.session.get_adapter(api.base_url).max_retries
+
+        assert retry.total == 5
+        assert retry.is_retry("GET", 503)
+        assert retry.is_retry("PUT", 429)
+        assert retry.is_retry("POST", 429)
+        assert not retry.is_retry("POST", 500)
+        assert not retry.is_retry("GET", 404)
+
+    def test_post_not_retried_after_send(self, api):
+        """A POST whose response was lost is not re-sent; a GET is"""
+        retry = api.session.get_adapter(api.base_url).max_retries
+        error = ProtocolError("Connection aborted.")
+
+        with pytest.raises(ProtocolError):
+            retry.increment(method="POST", url="/survey-definitions", error=error)
+        assert retry.increment(method="GET", url="/surveys", error=error).total == 4
+        assert retry.increment(
+            method="POST", url="/survey-definitions", error=ConnectTimeoutError()
+        ).total == 4
+
+    def test_serialization_round_trip(self):
+        """dumps/loads round-trip, including non-ASCII text"""
+        payload = {"Choices": {"1": {"Display": "Sí"}}, "ChoiceOrder": ["1"]}
+        assert isinstance(dumps(payload), bytes)
+        assert loads(dumps(payload)) == payload
+
+
+class TestListSurveys:
+    """Tests for paginated survey listing"""
+
+    @patch('requests.Session.get')
+    def test_follows_next_page(self, mock_get, api):
+        """iter_surveys follows nextPage links until exhausted"""
+        next_url = f"{api.base_url}/surveys?offset=2"
+        mock_get.side_effect = [
+            Mock(status_code=200, headers={}, json=lambda: {"result": {
+                "elements": [{"id": "SV_1"}, {"id": "SV_2"}], "nextPage": next_url}}),
+            Mock(status_code=200, headers={}, json=lambda: {"result": {
+                "elements": [{"id": "SV_3"}], "nextPage": None}}),
+        ]
+
+        surveys = api.list_surveys()
+
+        assert [s["id"] for s in surveys] == ["SV_1", "SV_2", "SV_3"]
+        assert mock_get.call_args[0][0] == next_url
+
+    @patch('requests.Session.get')
+    def test_iter_is_lazy(self, mock_get, api):
+        """Later pages are only fetched once the caller gets that far"""
+        mock_get.return_value = Mock(status_code=200, headers={}, json=lambda: {"result": {
+            "elements": [{"id": "SV_1"}], "nextPage": f"{api.base_url}/surveys?offset=1"}})
+
+        first = next(api.iter_surveys())
+
+        assert first == {"id": "SV_1"}
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_pages_are_not_cached(self, mock_get, api):
+        """Paging through the account keeps no pages in the cache"""
+        mock_get.side_effect = [
+            Mock(status_code=200, headers={}, json=lambda: {"result": {
+                "elements": [{"id": "SV_1"}], "nextPage": f"{api.base_url}/surveys?offset=1"}}),
+            Mock(status_code=200, headers={}, json=lambda: {"result": {
+                "elements": [{"id": "SV_2"}], "nextPage": None}}),
+        ]
+
+        api.list_surveys()
+
+        assert api._cache == {}
+
+
+class TestResponseCache:
+    """Tests for the cached GET path"""
+
+    @patch('requests.Session.get')
+    def test_repeat_reads_hit_cache(self, mock_get, api):
+        """A second read within the TTL should not hit the network"""
+        mock_get.return_value = Mock(
+            status_code=200, headers={}, json=lambda: {"result": {"SurveyName": "S"}}
+        )
+
+        first = api.get_survey("SV_123")
+        first["SurveyName"] = "mutated"
+        second = api.get_survey("SV_123")
+
+        assert second == {"SurveyName": "S"}
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_expired_entry_revalidates_with_etag(self, mock_get, api):
+        """An expired entry is revalidated with If-None-Match and reused on 304"""
+        mock_get.side_effect = [
+            Mock(status_code=200, headers={"ETag": '"v1"'},
+                 json=lambda: {"result": {"QuestionID": "QID1"}}),
+            Mock(status_code=304, headers={}),
+        ]
+        api.cache_ttl = 1e-9
+
+        api.get_question("SV_123", "QID1")
+        result = api.get_question("SV_123", "QID1")
+
+        assert result == {"QuestionID": "QID1"}
+        assert mock_get.call_args[1]["headers"] == {"If-None-Match": '"v1"'}
+
+    @patch('requests.Session.get')
+    def test_expired_entries_are_pruned(self, mock_get, api):
+        """Caching a new read drops entries that have outlived cache_ttl"""
+        mock_get.return_value = Mock(
+            status_code=200, headers={}, json=lambda: {"result": {"SurveyName": "S"}}
+        )
+        api.cache_ttl = 0.01
+        api.get_survey("SV_1")
+        api.get_survey("SV_2")
+        time.sleep(0.02)
+
+        api.get_survey("SV_3")
+
+        assert list(api._cache) == [f"{api.base_url}/survey-definitions/SV_3"]
+
+    @patch('requests.Session.get')
+    def test_write_invalidates_survey_entries(self, mock_get, api):
+        """A write response for a survey evicts that survey's cached reads"""
+        mock_get.return_value = Mock(
+            status_code=200, headers={}, json=lambda: {"result": {"SurveyName": "S"}}
+        )
+        api.get_survey("SV_123")
+        api.get_survey("SV_999")
+
+        api._invalidate_on_write(Mock(request=Mock(
+            method="PUT", url=f"{api.base_url}/survey-definitions/SV_123/questions/QID1"
+        )))
+        api.get_survey("SV_123")
+        api.get_survey("SV_999")
+
+        assert mock_get.call_count == 3
+
+    @patch('requests.Session.get')
+    def test_question_write_keeps_sibling_questions(self, mock_get, api):
+        """Writing one question drops it and the survey, not other questions"""
+        mock_get.return_value = Mock(
+            status_code=200, headers={}, json=lambda: {"result": {"QuestionID": "Q"}}
+        )
+        api.get_question("SV_123", "QID1")
+        api.get_question("SV_123", "QID2")
+
+        api._invalidate_on_write(Mock(request=Mock(
+            method="PUT", url=f"{api.base_url}/survey-definitions/SV_123/questions/QID1"
+        )))
+        api.get_question("SV_123", "QID1")
+        api.get_question("SV_123", "QID2")
+
+        assert mock_get.call_count == 3
+
+    @patch('requests.Session.get')
+    def test_question_write_drops_flow_and_blocks(self, mock_get, api):
+        """Flow and block entries embed membership, so any write drops them"""
+        mock_get.return_value = Mock(
+            status_code=200, headers={}, json=lambda: {"result": {"Flow": []}}
+        )
+        api.get_survey_flow("SV_123")
+        api._cached_get("/survey-definitions/SV_123/blocks/BL_1", "get block")
+
+        api._invalidate_on_write(Mock(request=Mock(
+            method="POST", url=f"{api.base_url}/survey-definitions/SV_123/questions"
+        )))
+        api.get_survey_flow("SV_123")
+        api._cached_get("/survey-definitions/SV_123/blocks/BL_1", "get block")
+
+        assert mock_get.call_count == 4
+
+    @patch('requests.Session.put')
+    @patch('requests.Session.get')
+    def test_display_logic_edits_reuse_updated_question(self, mock_get, mock_put, api):
+        """A PUT seeds the cache, so the next edit of that question skips the GET"""
+        mock_get.return_value = Mock(status_code=200, headers={}, json=lambda: {"result": {
+            "QuestionID": "QID2", "QuestionText": "Why?", "QuestionType": "TE",
+            "Selector": "SL", "Configuration": {"QuestionDescriptionOption": "UseText"},
+        }})
+        mock_put.return_value = Mock(status_code=200)
+
+        api.add_display_logic("SV_123", "QID2", "QID1", "Selected",
+                              choice_locator="q://QID1/SelectableChoice/1")
+        api.delete_display_logic("SV_123", "QID2")
+
+        mock_get.assert_called_once()
+        assert api.get_question("SV_123", "QID2")["DisplayLogic"] is None
+        assert api.get_question("SV_123", "QID2")["Configuration"]
+
+    @patch('requests.Session.put')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_new_survey_defaults_skip_flow_get(self, mock_post, mock_get, mock_put, api):
+        """The default embedded data for a new survey is set without fetching its flow"""
+        mock_post.return_value = Mock(status_code=200, json=lambda: {
+            "result": {"SurveyID": "SV_new", "DefaultBlockID": "BL_1"}
+        })
+        mock_get.return_value = Mock(status_code=200, headers={}, json=lambda: {"result": {}})
+        mock_put.return_value = Mock(status_code=200)
+
+        api.create_survey("New")
+
+        fetched = [c[0][0] for c in mock_get.call_args_list]
+        assert not any(url.endswith("/flow") for url in fetched)
+        flow = mock_put.call_args[1]["json"]["Flow"]
+        assert [e["Type"] for e in flow] == ["EmbeddedData", "Block"]
+        assert flow[0]["FlowID"] == "FL_3"
+
+    @patch('requests.Session.put')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_new_survey_flow_is_not_cached(self, mock_post, mock_get, mock_put, api):
+        """The assumed flow of a new survey never serves later reads"""
+        mock_post.return_value = Mock(status_code=200, json=lambda: {
+            "result": {"SurveyID": "SV_new", "DefaultBlockID": "BL_1"}
+        })
+        mock_get.return_value = Mock(status_code=200, headers={}, json=lambda: {"result": {}})
+        mock_put.return_value = Mock(status_code=200)
+
+        api.create_survey("New", setup_defaults=False)
+        api.get_survey_flow("SV_new")
+        api.create_survey("Newer")
+        api.get_survey_flow("SV_new")
+
+        fetched = [c[0][0] for c in mock_get.call_args_list]
+        assert sum(url.endswith("/SV_new/flow") for url in fetched) == 2
+
+    @patch('requests.Session.put')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_new_survey_defaults_retry_only_on_4xx(self, mock_post, mock_get, mock_put, api):
+        """A rejected default update is retried against the real flow; a 5xx is raised"""
+        mock_post.return_value = Mock(status_code=200, json=lambda: {
+            "result": {"SurveyID": "SV_new", "DefaultBlockID": "BL_1"}
+        })
+        mock_get.return_value = Mock(status_code=200, headers={}, json=lambda: {"result": {
+            "FlowID": "FL_1", "Type": "Root",
+            "Flow": [{"Type": "Block", "ID": "BL_1", "FlowID": "FL_5"}],
+        }})
+        mock_put.side_effect = [Mock(status_code=200), Mock(status_code=400), Mock(status_code=200)]
+
+        api.create_survey("New")
+
+        assert mock_put.call_args[1]["json"]["Flow"][0]["FlowID"] == "FL_6"
+
+        mock_put.side_effect = [Mock(status_code=200), Mock(status_code=503)]
+        with pytest.raises(QualtricsAPIError):
+            api.create_survey("New")
+        assert mock_put.call_count == 5
+
+    def test_concurrent_misses_share_one_get(self, api):
+        """Threads missing the cache for the same URL wait on a single GET"""
+        api.cache_ttl = 0  # so only the shared in-flight GET can dedupe
+        started, release = threading.Event(), threading.Event()
+
+        def slow_get(url, **kwargs):
+            started.set()
+            release.wait(5)
+            return Mock(status_code=200, headers={}, json=lambda: {"result": {"Flow": []}})
+
+        results = []
+        with patch('requests.Session.get', side_effect=slow_get) as mock_get:
+            threads = [threading.Thread(
+                target=lambda: results.append(api.get_survey_flow("SV_123"))
+            ) for _ in range(3)]
+            threads[0].start()
+            started.wait(5)
+            for thread in threads[1:]:
+                thread.start()
+            time.sleep(0.05)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert results == [{"Flow": []}] * 3
+        mock_get.assert_called_once()
+        assert results[0] is not results[1]
+
+
+class TestRequestHelper:
+    """Tests for the shared _request helper"""
+
+    @patch('requests.Session.delete')
+    def test_success_without_result(self, mock_delete, api):
+        """parse_result=False returns True on success"""
+        mock_delete.return_value = Mock(status_code=200)
+
+        assert api.delete_survey("SV_123") is True
+        assert mock_delete.call_args[0][0] == f"{api.base_url}/survey-definitions/SV_123"
+
+    @patch('requests.Session.post')
+    def test_failure_raises_structured_error(self, mock_post, api):
+        """Non-200 responses raise QualtricsAPIError with status and body"""
+        mock_post.return_value = Mock(status_code=400, text='{"meta": "bad"}')
+
+        with pytest.raises(QualtricsAPIError) as exc_info:
+            api.create_block("SV_123", "Block")
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.op == "create block"
+        assert "Failed to create block" in str(exc_info.value)
+
+    @patch('requests.Session.post')
+    def test_error_body_is_read_lazily(self, mock_post, api):
+        """The response body is only decoded when the error is formatted"""
+        response = Mock(status_code=400)
+        text = PropertyMock(return_value='{"meta": "bad"}')
+        type(response).text = text
+        mock_post.return_value = response
+
+        with pytest.raises(QualtricsAPIError) as exc_info:
+            api.create_block("SV_123", "Block")
+
+        text.assert_not_called()
+        assert exc_info.value.body == '{"meta": "bad"}'
+        assert str(exc_info.value) == 'Failed to create block: {"meta": "bad"}'
+
+
+class TestTypedSurvey:
+    """Tests for get_survey_typed"""
+
+    @patch('requests.Session.get')
+    def test_blocks_and_questions_are_typed(self, mock_get, api):
+        """The definition converts to structs and iterates in block order"""
+        pytest.importorskip("msgspec")
+        mock_get.return_value = Mock(status_code=200, headers={}, json=lambda: {"result": {
+            "SurveyID": "SV_1",
+            "Blocks": {"BL_1": {"Type": "Default", "BlockElements": [
+                {"Type": "Question", "QuestionID": "QID2"},
+                {"Type": "Page Break"},
+                {"Type": "Question", "QuestionID": "QID1"},
+            ]}},
+            "Questions": {"QID1": {"QuestionText": "a"}, "QID2": {"QuestionText": "b"}},
+            "SurveyOptions": {},
+        }})
+
+        survey = api.get_survey_typed("SV_1")
+
+        assert survey.Blocks["BL_1"].BlockElements[1].QuestionID is None
+        assert [q["QuestionText"] for q in survey.iter_questions()] == ["b", "a"]
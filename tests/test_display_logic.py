@@ -13,6 +13,7 @@ from unittest.mock import Mock, patch, MagicMock
 import json
 
 # Import the mixin class
+from qualtrics_sdk.core.base import APIBase
 from qualtrics_sdk.core.display_logic import DisplayLogicMixin
 
 
@@ -22,13 +23,9 @@ class TestDisplayLogicMixin:
     @pytest.fixture
     def mixin(self):
         """Create a DisplayLogicMixin instance with mocked base attributes"""
-        class TestClient(DisplayLogicMixin):
+        class TestClient(APIBase, DisplayLogicMixin):
             def __init__(self):
-                self.base_url = "https://test.qualtrics.com/API/v3"
-                self.headers = {
-                    'X-API-TOKEN': 'test_token',
-                    'Content-Type': 'application/json'
-                }
+                super().__init__(api_token='test_token', data_center='test.qualtrics.com')
 
             def get_question(self, survey_id, question_id):
                 """Mock get_question method"""
@@ -80,11 +77,18 @@ class TestDisplayLogicMixin:
         assert condition['Operator'] == 'EqualTo'
         assert condition['RightOperand'] == 'premium'
 
+    def test_build_condition_invalid_logic_type(self, mixin):
+        """Unsupported logic types raise instead of returning a partial condition"""
+        with pytest.raises(ValueError) as exc_info:
+            mixin._build_condition(question_id="QID1", operator="Displayed", logic_type="Quota")
+
+        assert "Invalid logic_type" in str(exc_info.value)
+
     # =========================================================================
     # Tests for add_display_logic
     # =========================================================================
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_add_display_logic_success(self, mock_put, mixin):
         """Test successful display logic addition"""
         mock_put.return_value = Mock(status_code=200, text='{}')
@@ -105,7 +109,7 @@ class TestDisplayLogicMixin:
         assert 'SV_test123' in call_args[0][0]
         assert 'QID2' in call_args[0][0]
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_add_display_logic_failure(self, mock_put, mixin):
         """Test display logic addition failure"""
         mock_put.return_value = Mock(status_code=400, text='Error message')
@@ -137,7 +141,7 @@ class TestDisplayLogicMixin:
     # Tests for add_display_logic_multiple
     # =========================================================================
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_add_display_logic_multiple_and(self, mock_put, mixin):
         """Test multiple conditions with AND conjunction"""
         mock_put.return_value = Mock(status_code=200, text='{}')
@@ -168,7 +172,7 @@ class TestDisplayLogicMixin:
         payload = call_args[1]['json']
         assert 'DisplayLogic' in payload
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_add_display_logic_multiple_or(self, mock_put, mixin):
         """Test multiple conditions with OR conjunction"""
         mock_put.return_value = Mock(status_code=200, text='{}')
@@ -231,11 +235,44 @@ class TestDisplayLogicMixin:
 
         assert "Invalid operator" in str(exc_info.value)
 
+    @patch('requests.Session.put')
+    def test_malformed_references_fail_before_request(self, mock_put, mixin):
+        """Bad question IDs and choice locators raise without any request"""
+        with pytest.raises(ValueError) as exc_info:
+            mixin.add_display_logic("SV_test123", "2", "QID1", "Displayed")
+        assert "Invalid question ID '2'" in str(exc_info.value)
+
+        with pytest.raises(ValueError) as exc_info:
+            mixin.add_display_logic(
+                "SV_test123", "QID2", "QID1", "Selected", choice_locator="QID1/1"
+            )
+        assert "Invalid choice_locator" in str(exc_info.value)
+
+        mock_put.assert_not_called()
+
+    def test_add_display_logic_multiple_reports_every_invalid_operator(self, mixin):
+        """All invalid conditions are reported together"""
+        with pytest.raises(ValueError) as exc_info:
+            mixin.add_display_logic_multiple(
+                survey_id="SV_test123",
+                question_id="QID3",
+                conditions=[
+                    {"source_question_id": "QID1", "operator": "Bad"},
+                    {"source_question_id": "QID2", "operator": "Selected"},
+                    {"source_question_id": "QID2", "operator": "Worse"},
+                    {"operator": "Selected"},
+                ]
+            )
+
+        assert "'Bad' in condition 0" in str(exc_info.value)
+        assert "'Worse' in condition 2" in str(exc_info.value)
+        assert "Missing source_question_id in condition 3" in str(exc_info.value)
+
     # =========================================================================
     # Tests for show_only_if
     # =========================================================================
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_show_only_if(self, mock_put, mixin):
         """Test show_only_if helper method"""
         mock_put.return_value = Mock(status_code=200, text='{}')
@@ -255,7 +292,7 @@ class TestDisplayLogicMixin:
     # Tests for skip_if
     # =========================================================================
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_skip_if_inverts_selected(self, mock_put, mixin):
         """Test skip_if inverts Selected to NotSelected"""
         mock_put.return_value = Mock(status_code=200, text='{}')
@@ -303,13 +340,28 @@ class TestDisplayLogicMixin:
 
         assert result is None
 
+    def test_update_payload_keeps_present_optional_fields(self, mixin):
+        """Non-empty optional fields are carried over; empty ones are dropped"""
+        payload = mixin._build_question_update_payload(
+            {'QuestionText': 'Rate', 'QuestionType': 'Matrix', 'Selector': 'Likert',
+             'Answers': {'1': {'Display': 'Low'}}, 'Choices': {}},
+            "QID7", None
+        )
+
+        assert payload['DataExportTag'] == 'QQID7'
+        assert payload['Answers'] == {'1': {'Display': 'Low'}}
+        assert 'Choices' not in payload and 'SubSelector' not in payload
+
     # =========================================================================
     # Tests for delete_display_logic
     # =========================================================================
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_delete_display_logic_success(self, mock_put, mixin):
         """Test successful display logic deletion"""
+        mixin.get_question = Mock(return_value={
+            'QuestionID': 'QID2', 'DisplayLogic': {'Type': 'BooleanExpression'}
+        })
         mock_put.return_value = Mock(status_code=200, text='{}')
 
         result = mixin.delete_display_logic("SV_test123", "QID2")
@@ -322,9 +374,12 @@ class TestDisplayLogicMixin:
         payload = call_args[1]['json']
         assert payload['DisplayLogic'] is None
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_delete_display_logic_failure(self, mock_put, mixin):
         """Test display logic deletion failure"""
+        mixin.get_question = Mock(return_value={
+            'QuestionID': 'QID2', 'DisplayLogic': {'Type': 'BooleanExpression'}
+        })
         mock_put.return_value = Mock(status_code=400, text='Error message')
 
         with pytest.raises(Exception) as exc_info:
@@ -332,11 +387,26 @@ class TestDisplayLogicMixin:
 
         assert "Failed to delete display logic" in str(exc_info.value)
 
+    @patch('requests.Session.put')
+    def test_unchanged_display_logic_is_not_written(self, mock_put, mixin):
+        """Test deleting absent logic, or re-adding identical logic, sends no PUT"""
+        mock_put.return_value = Mock(status_code=200)
+        assert mixin.delete_display_logic("SV_test123", "QID2") is True
+
+        mixin.add_display_logic("SV_test123", "QID2", "QID1", "Selected",
+                                choice_locator="q://QID1/SelectableChoice/1")
+        logic = mock_put.call_args[1]['json']['DisplayLogic']
+        mixin.get_question = Mock(return_value={'QuestionID': 'QID2', 'DisplayLogic': logic})
+        mixin.add_display_logic("SV_test123", "QID2", "QID1", "Selected",
+                                choice_locator="q://QID1/SelectableChoice/1")
+
+        mock_put.assert_called_once()
+
     # =========================================================================
     # Tests for add_embedded_data_logic
     # =========================================================================
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_add_embedded_data_logic_success(self, mock_put, mixin):
         """Test successful embedded data logic addition"""
         mock_put.return_value = Mock(status_code=200, text='{}')
@@ -388,17 +458,16 @@ class TestIntegrationScenarios:
     @pytest.fixture
     def mixin(self):
         """Create a DisplayLogicMixin instance"""
-        class TestClient(DisplayLogicMixin):
+        class TestClient(APIBase, DisplayLogicMixin):
             def __init__(self):
-                self.base_url = "https://test.qualtrics.com/API/v3"
-                self.headers = {'X-API-TOKEN': 'test', 'Content-Type': 'application/json'}
+                super().__init__(api_token='test', data_center='test.qualtrics.com')
 
             def get_question(self, survey_id, question_id):
                 return {'QuestionID': question_id}
 
         return TestClient()
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_branching_survey_scenario(self, mock_put, mixin):
         """Test a complete branching survey scenario"""
         mock_put.return_value = Mock(status_code=200, text='{}')
@@ -413,7 +482,7 @@ class TestIntegrationScenarios:
         )
         assert result is True
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_satisfaction_followup_scenario(self, mock_put, mixin):
         """Test showing improvement question for low satisfaction"""
         mock_put.return_value = Mock(status_code=200, text='{}')
@@ -428,7 +497,7 @@ class TestIntegrationScenarios:
         )
         assert result is True
 
-    @patch('requests.put')
+    @patch('requests.Session.put')
     def test_multi_product_comparison_scenario(self, mock_put, mixin):
         """Test showing comparison only when multiple products selected"""
         mock_put.return_value = Mock(status_code=200, text='{}')
@@ -451,3 +520,50 @@ class TestIntegrationScenarios:
             conjunction="AND"
         )
         assert result is True
+
+
+class TestDisplayLogicBatch:
+    """Tests for add_display_logic_batch"""
+
+    @pytest.fixture
+    def api(self):
+        from qualtrics_sdk import QualtricsAPI
+        return QualtricsAPI(api_token='test_token', data_center='test.qualtrics.com')
+
+    @patch('requests.Session.put')
+    @patch('requests.Session.get')
+    def test_prefetches_survey_once(self, mock_get, mock_put, api):
+        """Target questions come from one survey GET, and failures are collected"""
+        questions = {
+            f'QID{i}': {'QuestionText': f'Q{i}', 'QuestionType': 'MC', 'Selector': 'SAVR'}
+            for i in range(1, 5)
+        }
+        mock_get.return_value = Mock(
+            status_code=200, headers={}, json=lambda: {'result': {'Questions': questions}}
+        )
+        mock_put.side_effect = lambda url, **kwargs: Mock(
+            status_code=400 if url.endswith('QID3') else 200, text='bad'
+        )
+
+        results = api.add_display_logic_batch('SV_123', [
+            {'question_id': 'QID2', 'source_question_id': 'QID1',
+             'operator': 'Selected', 'choice_locator': 'q://QID1/SelectableChoice/1'},
+            {'question_id': 'QID3', 'source_question_id': 'QID1', 'operator': 'Displayed'},
+            {'question_id': 'QID4', 'conditions': [
+                {'source_question_id': 'QID1', 'operator': 'Bogus'},
+            ]},
+        ])
+
+        mock_get.assert_called_once()
+        assert mock_put.call_count == 2
+        assert [r['success'] for r in results] == [True, False, False]
+        assert results[1]['error'].status_code == 400
+        assert isinstance(results[2]['error'], ValueError)
+
+    def test_duplicate_question_raises(self, api):
+        """A question targeted by two rules is rejected before any request"""
+        with pytest.raises(ValueError):
+            api.add_display_logic_batch('SV_123', [
+                {'question_id': 'QID2', 'source_question_id': 'QID1', 'operator': 'Displayed'},
+                {'question_id': 'QID2', 'source_question_id': 'QID3', 'operator': 'Displayed'},
+            ])
@@ -5,14 +5,18 @@ Run with: pytest tests/test_embedded_data.py -v
 """
 
 import pytest
+import requests
 from unittest.mock import Mock, patch
 import sys
 from pathlib import Path
+from urllib.parse import urlencode
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from qualtrics_sdk import QualtricsAPI
+from qualtrics_sdk.core.base import _JSONAdapter
+from qualtrics_sdk.utils.serialization import dumps, loads
 
 
 @pytest.fixture
@@ -72,8 +76,8 @@ def mock_flow_with_embedded_data():
 class TestSetEmbeddedData:
     """Tests for set_embedded_data method"""
 
-    @patch('requests.get')
-    @patch('requests.put')
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
     def test_set_embedded_data_text_field(self, mock_put, mock_get, api, mock_flow_response):
         """Test setting a text embedded data field"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_flow_response)
@@ -90,8 +94,8 @@ class TestSetEmbeddedData:
         assert result["field_type"] == "text"
         mock_put.assert_called_once()
 
-    @patch('requests.get')
-    @patch('requests.put')
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
     def test_set_embedded_data_number_field(self, mock_put, mock_get, api, mock_flow_response):
         """Test setting a number embedded data field"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_flow_response)
@@ -109,8 +113,8 @@ class TestSetEmbeddedData:
         assert result["field_type"] == "number"
         assert result["value"] == "100"
 
-    @patch('requests.get')
-    @patch('requests.put')
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
     def test_set_embedded_data_date_field(self, mock_put, mock_get, api, mock_flow_response):
         """Test setting a date embedded data field"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_flow_response)
@@ -135,7 +139,7 @@ class TestSetEmbeddedData:
             )
         assert "field_type must be one of" in str(exc_info.value)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_set_embedded_data_flow_fetch_fails(self, mock_get, api):
         """Test that exception is raised when flow fetch fails"""
         mock_get.return_value = Mock(status_code=400, text="Bad Request")
@@ -152,8 +156,8 @@ class TestSetEmbeddedData:
 class TestSetEmbeddedDataFields:
     """Tests for set_embedded_data_fields method"""
 
-    @patch('requests.get')
-    @patch('requests.put')
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
     def test_set_multiple_fields(self, mock_put, mock_get, api, mock_flow_response):
         """Test setting multiple embedded data fields at once"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_flow_response)
@@ -172,8 +176,8 @@ class TestSetEmbeddedDataFields:
         assert result["count"] == 3
         assert set(result["fields"]) == {"user_id", "score", "start_date"}
 
-    @patch('requests.get')
-    @patch('requests.put')
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
     def test_set_fields_with_existing_embedded_data(
         self, mock_put, mock_get, api, mock_flow_with_embedded_data
     ):
@@ -190,7 +194,74 @@ class TestSetEmbeddedDataFields:
 
         assert result["success"] is True
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
+    def test_merge_sends_only_changed_element(
+        self, mock_put, mock_get, api, mock_flow_with_embedded_data
+    ):
+        """Test merging into an existing element PUTs just that element"""
+        mock_get.return_value = Mock(
+            status_code=200, json=lambda: mock_flow_with_embedded_data
+        )
+        mock_put.return_value = Mock(status_code=200)
+
+        api.set_embedded_data_fields("SV_123", {"new_field": {"type": "text"}})
+
+        url = mock_put.call_args[0][0]
+        body = mock_put.call_args[1]["json"]
+        assert url.endswith("/survey-definitions/SV_123/flow/FL_1")
+        assert [f["Field"] for f in body["EmbeddedData"]] == ["existing_field", "new_field"]
+
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
+    def test_rejected_element_update_falls_back_to_full_flow(
+        self, mock_put, mock_get, api, mock_flow_with_embedded_data
+    ):
+        """Test a rejected element PUT is retried as a full flow PUT"""
+        mock_get.return_value = Mock(
+            status_code=200, json=lambda: mock_flow_with_embedded_data
+        )
+        mock_put.side_effect = [Mock(status_code=404), Mock(status_code=200)]
+
+        api.set_embedded_data_fields("SV_123", {"new_field": {"type": "text"}})
+
+        assert mock_put.call_args[0][0].endswith("/survey-definitions/SV_123/flow")
+        assert "Flow" in mock_put.call_args[1]["json"]
+
+    def test_flow_refetched_after_block_write(self, api):
+        """A block created after the flow was cached is kept by the next edit"""
+        server_flow = {
+            "FlowID": "FL_1", "Type": "Root", "Properties": {"Count": 2},
+            "Flow": [{"Type": "Block", "ID": "BL_1", "FlowID": "FL_2"}],
+        }
+        puts = []
+
+        def send(request, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.request = request
+            response.url = request.url
+            if request.method == "POST":
+                server_flow["Flow"].append({"Type": "Standard", "ID": "BL_2", "FlowID": "FL_3"})
+                server_flow["Properties"]["Count"] = 3
+                response._content = dumps({"result": {"BlockID": "BL_2"}})
+            elif request.method == "PUT":
+                puts.append(loads(request.body))
+                response._content = b"{}"
+            else:
+                response._content = dumps({"result": server_flow})
+            return response
+
+        with patch.object(_JSONAdapter, "send", side_effect=send):
+            api.get_embedded_data("SV_123")
+            api.create_block("SV_123", "Block 2")
+            api.set_embedded_data("SV_123", "user_id")
+
+        flow = puts[-1]["Flow"]
+        assert [e.get("ID") for e in flow if e["Type"] != "EmbeddedData"] == ["BL_1", "BL_2"]
+        assert flow[0]["FlowID"] == "FL_4"
+
+    @patch('requests.Session.get')
     def test_set_fields_invalid_type(self, mock_get, api, mock_flow_response):
         """Test that invalid field type raises ValueError"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_flow_response)
@@ -202,11 +273,91 @@ class TestSetEmbeddedDataFields:
             )
         assert "field_type for 'test' must be one of" in str(exc_info.value)
 
+    @patch('requests.Session.get')
+    def test_set_fields_empty_name_fails_before_request(self, mock_get, api):
+        """Test that a blank field name is rejected without fetching the flow"""
+        with pytest.raises(ValueError, match="non-empty string"):
+            api.set_embedded_data_fields("SV_123", {"ok": {}, "  ": {"value": "x"}})
+
+        mock_get.assert_not_called()
+
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
+    def test_new_flow_id_skips_deeply_nested_ids(self, mock_put, mock_get, api):
+        """Test the new element's FlowID is unique across every nesting level"""
+        flow = {"result": {"FlowID": "FL_1", "Type": "Root", "Flow": [
+            {"Type": "Branch", "FlowID": "FL_2", "Flow": [
+                {"Type": "Branch", "FlowID": "FL_3", "Flow": [
+                    {"Type": "Standard", "ID": "BL_1", "FlowID": "FL_7"}
+                ]}
+            ]}
+        ]}}
+        mock_get.return_value = Mock(status_code=200, json=lambda: flow)
+        mock_put.return_value = Mock(status_code=200)
+
+        api.set_embedded_data_fields("SV_123", {"user_id": {"type": "text"}})
+
+        assert mock_put.call_args[1]["json"]["Flow"][0]["FlowID"] == "FL_8"
+        assert mock_put.call_args[1]["json"]["Properties"] == {"Count": 8}
+
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
+    def test_bulk_reports_each_survey(self, mock_put, mock_get, api, mock_flow_response):
+        """Test bulk configuration keeps going past a failing survey"""
+        mock_get.return_value = Mock(status_code=200, json=lambda: mock_flow_response)
+        mock_put.side_effect = lambda url, **kwargs: Mock(
+            status_code=500 if "SV_bad" in url else 200, text="error"
+        )
+
+        results = api.set_embedded_data_fields_bulk({
+            "SV_1": {"cohort": {"value": "A"}},
+            "SV_bad": {"cohort": {"value": "B"}},
+            "SV_2": {"cohort": {"value": "C"}},
+        })
+
+        assert [r["survey_id"] for r in results] == ["SV_1", "SV_bad", "SV_2"]
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[1]["error"].status_code == 500
+
+
+class TestAddRandomizer:
+    """Tests for add_randomizer method"""
+
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
+    def test_flow_count_is_highest_flow_id(self, mock_put, mock_get, api):
+        """Test Properties.Count tracks the highest FlowID after the insert"""
+        flow = {"result": {"FlowID": "FL_1", "Type": "Root", "Flow": [
+            {"Type": "Block", "ID": "BL_1", "FlowID": "FL_2"},
+            {"Type": "Standard", "ID": "BL_2", "FlowID": "FL_9"},
+        ], "Properties": {"Count": 9}}}
+        mock_get.return_value = Mock(status_code=200, json=lambda: flow)
+        mock_put.return_value = Mock(status_code=200)
+
+        result = api.add_randomizer("SV_123", ["BL_2", {"arm": "A"}])
+
+        body = mock_put.call_args[1]["json"]
+        assert result["FlowID"] == "FL_12"
+        assert body["Properties"]["Count"] == 12
+        assert [e["FlowID"] for e in body["Flow"][0]["Flow"]] == ["FL_10", "FL_11"]
+
+    @patch('requests.Session.get')
+    def test_invalid_arguments_fail_before_request(self, mock_get, api):
+        """Test bad elements, subset and position are rejected without a GET"""
+        with pytest.raises(ValueError, match="block ID string or a dict"):
+            api.add_randomizer("SV_123", ["BL_1", 42])
+        with pytest.raises(ValueError, match="subset"):
+            api.add_randomizer("SV_123", ["BL_1", "BL_2"], subset=3)
+        with pytest.raises(ValueError, match="position"):
+            api.add_randomizer("SV_123", ["BL_1"], position=-1)
+
+        mock_get.assert_not_called()
+
 
 class TestGetEmbeddedData:
     """Tests for get_embedded_data method"""
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_embedded_data(self, mock_get, api, mock_flow_with_embedded_data):
         """Test retrieving embedded data fields"""
         mock_get.return_value = Mock(
@@ -218,7 +369,7 @@ class TestGetEmbeddedData:
         assert len(result) == 1
         assert result[0]["Field"] == "existing_field"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_embedded_data_empty(self, mock_get, api, mock_flow_response):
         """Test retrieving embedded data when none exists"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_flow_response)
@@ -231,8 +382,8 @@ class TestGetEmbeddedData:
 class TestDeleteEmbeddedData:
     """Tests for delete_embedded_data method"""
 
-    @patch('requests.get')
-    @patch('requests.put')
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
     def test_delete_embedded_data(self, mock_put, mock_get, api, mock_flow_with_embedded_data):
         """Test deleting an embedded data field"""
         mock_get.return_value = Mock(
@@ -247,7 +398,61 @@ class TestDeleteEmbeddedData:
 
         assert result is True
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
+    def test_transaction_applies_edits_in_one_put(
+        self, mock_put, mock_get, api, mock_flow_with_embedded_data
+    ):
+        """Test a transaction fetches and writes the flow once for all edits"""
+        mock_get.return_value = Mock(
+            status_code=200, json=lambda: mock_flow_with_embedded_data
+        )
+        mock_put.return_value = Mock(status_code=200)
+
+        with api.embedded_data_transaction("SV_123") as tx:
+            tx.set_field("condition", value="A")
+            tx.set_fields({"score": {"type": "number"}})
+            tx.delete_field("existing_field")
+
+        mock_get.assert_called_once()
+        mock_put.assert_called_once()
+        body = mock_put.call_args[1]["json"]
+        assert [f["Field"] for f in body["EmbeddedData"]] == ["condition", "score"]
+
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
+    def test_unchanged_flow_is_not_written(
+        self, mock_put, mock_get, api, mock_flow_with_embedded_data
+    ):
+        """Test re-setting a field to its current configuration sends no PUT"""
+        mock_get.return_value = Mock(
+            status_code=200, json=lambda: mock_flow_with_embedded_data
+        )
+
+        result = api.set_embedded_data("SV_123", "existing_field")
+
+        assert result["success"] is True
+        mock_put.assert_not_called()
+
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
+    def test_transaction_discards_edits_on_error(
+        self, mock_put, mock_get, api, mock_flow_with_embedded_data
+    ):
+        """Test nothing is written when the with block raises"""
+        mock_get.return_value = Mock(
+            status_code=200, json=lambda: mock_flow_with_embedded_data
+        )
+
+        with pytest.raises(Exception, match="not found"):
+            with api.embedded_data_transaction("SV_123") as tx:
+                tx.set_field("condition", value="A")
+                tx.delete_field("missing")
+
+        mock_put.assert_not_called()
+        assert [f["Field"] for f in api.get_embedded_data("SV_123")] == ["existing_field"]
+
+    @patch('requests.Session.get')
     def test_delete_nonexistent_field(self, mock_get, api, mock_flow_response):
         """Test deleting a field that doesn't exist"""
         mock_get.return_value = Mock(status_code=200, json=lambda: mock_flow_response)
@@ -305,12 +510,28 @@ class TestGetSurveyUrlWithEmbeddedData:
 
         assert url.startswith("https://test.qualtrics.com/jfe/form/SV_abc123?")
 
+    def test_query_string_matches_urlencode(self, api):
+        """Test the query string is byte-for-byte what urlencode produces"""
+        embedded_data = {"id": "abc123", "name": "Zoë O'Neil", "n": 5, "a b": "x/y"}
+
+        url = api.get_survey_url_with_embedded_data("SV_123", embedded_data)
+
+        assert url.split("?", 1)[1] == urlencode(embedded_data)
+
+    def test_compiled_template_matches_generic_url(self, api):
+        """Test the compiled template encodes values like the generic path"""
+        make_url = api.compile_survey_url_template("SV_123", ["user_id", "tag"])
+
+        url = make_url({"user_id": 42, "tag": "a&b c", "unused": "x"})
+
+        assert url == "https://test.qualtrics.com/jfe/form/SV_123?user_id=42&tag=a%26b%20c"
+
 
 class TestIntegration:
     """Integration-style tests for embedded data workflow"""
 
-    @patch('requests.get')
-    @patch('requests.put')
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
     def test_full_workflow(self, mock_put, mock_get, api, mock_flow_response):
         """Test a complete embedded data workflow"""
         # Setup mocks
@@ -344,6 +565,19 @@ class TestIntegration:
         assert "score=95" in url
         assert "enrolled_date=2026-01-15" in url
 
+    @patch('requests.Session.get')
+    @patch('requests.Session.put')
+    def test_consecutive_edits_fetch_flow_once(self, mock_put, mock_get, api, mock_flow_response):
+        """Each PUT re-seeds the cached flow, so later edits see it without a GET"""
+        mock_get.return_value = Mock(status_code=200, headers={}, json=lambda: mock_flow_response)
+        mock_put.return_value = Mock(status_code=200)
+
+        api.set_embedded_data("SV_123", "first", "text")
+        api.set_embedded_data("SV_123", "second", "number")
+
+        mock_get.assert_called_once()
+        assert [f["Field"] for f in api.get_embedded_data("SV_123")] == ["first", "second"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,73 @@
+"""
+Unit tests for QuestionManagementMixin
+
+Run with: pytest tests/test_question_management.py -v
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from qualtrics_sdk import QualtricsAPI
+
+
+@pytest.fixture
+def api():
+    """Create a QualtricsAPI instance for testing"""
+    return QualtricsAPI(api_token="test_token", data_center="test.qualtrics.com")
+
+
+@pytest.fixture
+def mock_survey_definition():
+    """Mock survey definition with two blocks and embedded questions"""
+    return {
+        "result": {
+            "Blocks": {
+                "BL_1": {
+                    "BlockElements": [
+                        {"Type": "Question", "QuestionID": "QID2"},
+                        {"Type": "Page Break"},
+                        {"Type": "Question", "QuestionID": "QID1"},
+                    ]
+                },
+                "BL_2": {
+                    "BlockElements": [
+                        {"Type": "Question", "QuestionID": "QID3"},
+                    ]
+                },
+            },
+            "Questions": {
+                "QID1": {"QuestionID": "QID1", "QuestionText": "First"},
+                "QID2": {"QuestionID": "QID2", "QuestionText": "Second"},
+                "QID3": {"QuestionID": "QID3", "QuestionText": "Third"},
+            },
+        }
+    }
+
+
+class TestGetSurveyQuestions:
+    """Tests for get_survey_questions"""
+
+    @patch('requests.Session.get')
+    def test_single_request_in_block_order(self, mock_get, api, mock_survey_definition):
+        """Questions come from the survey definition in block order"""
+        mock_get.return_value = Mock(status_code=200, json=lambda: mock_survey_definition)
+
+        questions = api.get_survey_questions("SV_123")
+
+        assert [q["QuestionID"] for q in questions] == ["QID2", "QID1", "QID3"]
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_falls_back_for_missing_question(self, mock_get, api, mock_survey_definition):
+        """A question missing from the definition is fetched individually"""
+        del mock_survey_definition["result"]["Questions"]["QID3"]
+        mock_get.side_effect = [
+            Mock(status_code=200, json=lambda: mock_survey_definition),
+            Mock(status_code=200, json=lambda: {"result": {"QuestionID": "QID3"}}),
+        ]
+
+        questions = api.get_survey_questions("SV_123")
+
+        assert questions[-1] == {"QuestionID": "QID3"}
+        assert mock_get.call_count == 2
+        assert mock_get.call_args[0][0].endswith("/questions/QID3")
@@ -0,0 +1,51 @@
+"""
+Unit tests for QuestionMixin
+
+Run with: pytest tests/test_questions.py -v
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from qualtrics_sdk import QualtricsAPI
+
+
+@pytest.fixture
+def api():
+    """Create a QualtricsAPI instance for testing"""
+    return QualtricsAPI(api_token="test_token", data_center="test.qualtrics.com")
+
+
+class TestCreateQuestionsBulk:
+    """Tests for create_questions_bulk"""
+
+    @patch('requests.Session.post')
+    def test_results_follow_spec_order(self, mock_post, api):
+        """Results are returned in the order of the input specs"""
+        def respond(url, json=None, params=None):
+            return Mock(
+                status_code=200,
+                json=lambda: {"result": {"QuestionID": json["QuestionText"]}},
+            )
+        mock_post.side_effect = respond
+
+        results = api.create_questions_bulk("SV_123", [
+            {"type": "mc", "question_text": "Q_a", "choices": ["Yes", "No"]},
+            {"type": "text", "question_text": "Q_b"},
+            {"type": "descriptive", "text": "Q_c"},
+        ], max_workers=3)
+
+        assert [r["QuestionID"] for r in results] == ["Q_a", "Q_b", "Q_c"]
+        assert mock_post.call_count == 3
+
+    def test_invalid_type_fails_before_any_request(self, api):
+        """An unknown question type raises before anything is sent"""
+        with patch('requests.Session.post') as mock_post:
+            with pytest.raises(ValueError) as exc_info:
+                api.create_questions_bulk("SV_123", [
+                    {"type": "mc", "question_text": "Q", "choices": ["A"]},
+                    {"type": "bogus", "question_text": "Q"},
+                ])
+
+        assert "Invalid question type" in str(exc_info.value)
+        mock_post.assert_not_called()
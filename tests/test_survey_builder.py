@@ -0,0 +1,85 @@
+"""
+Unit tests for SurveyBuilder and create_survey_from_definition
+
+Run with: pytest tests/test_survey_builder.py -v
+"""
+
+import json
+
+import pytest
+from unittest.mock import Mock, patch
+
+from qualtrics_sdk import QualtricsAPI, SurveyBuilder
+
+
+@pytest.fixture
+def api():
+    """Create a QualtricsAPI instance for testing"""
+    return QualtricsAPI(api_token="test_token", data_center="test.qualtrics.com")
+
+
+class TestSurveyBuilder:
+    """Tests for building a survey definition locally"""
+
+    def test_questions_are_placed_in_blocks(self):
+        """Questions go to the default block unless a block_id is given"""
+        builder = SurveyBuilder("My Survey")
+        q1 = builder.add("mc", question_text="Role?", choices=["A", "B"])
+        block_id = builder.add_block("Feedback")
+        q2 = builder.create_text_entry_question(None, "Comments?", block_id=block_id)["QuestionID"]
+
+        definition = builder.build()
+        elements = {e["Element"]: e for e in definition["SurveyElements"]}
+        blocks = elements["BL"]["Payload"]
+
+        assert definition["SurveyEntry"]["SurveyName"] == "My Survey"
+        assert [q1, q2] == ["QID1", "QID2"]
+        assert blocks[0]["BlockElements"] == [{"Type": "Question", "QuestionID": "QID1"}]
+        assert blocks[1]["BlockElements"] == [{"Type": "Question", "QuestionID": "QID2"}]
+        assert [f["ID"] for f in elements["FL"]["Payload"]["Flow"]] == ["BL_1", "BL_2"]
+
+    def test_question_payload_matches_create_methods(self, api):
+        """SQ payloads are the same shape the create_* methods send"""
+        builder = SurveyBuilder("S")
+        builder.add("matrix", question_text="Rate", statements=["x"], scale_points=["1", "2"])
+
+        sq = [e for e in builder.build()["SurveyElements"] if e["Element"] == "SQ"]
+        expected = api._question_payload(
+            'matrix', "Rate",
+            Choices={"1": {"Display": "x"}},
+            Answers={"1": {"Display": "1"}, "2": {"Display": "2"}},
+        )
+
+        assert len(sq) == 1
+        assert sq[0]["Payload"] == {"DataExportTag": "Q1", **expected, "QuestionID": "QID1"}
+
+    def test_unknown_block_raises(self):
+        """Adding to a block that does not exist raises ValueError"""
+        builder = SurveyBuilder("S")
+        with pytest.raises(ValueError) as exc_info:
+            builder.add("text", question_text="Q", block_id="BL_9")
+        assert "not found" in str(exc_info.value)
+
+
+class TestCreateSurveyFromDefinition:
+    """Tests for importing a built definition"""
+
+    @patch('requests.Session.post')
+    def test_imports_in_one_request(self, mock_post, api):
+        """The whole definition is uploaded as a single QSF file"""
+        mock_post.return_value = Mock(
+            status_code=200, json=lambda: {"result": {"id": "SV_new"}}
+        )
+        builder = SurveyBuilder("My Survey")
+        for i in range(50):
+            builder.add("text", question_text=f"Q{i}")
+
+        result = api.create_survey_from_definition(builder.build(), setup_defaults=False)
+
+        assert result["SurveyID"] == "SV_new"
+        assert mock_post.call_count == 1
+        args, kwargs = mock_post.call_args
+        assert args[0] == f"{api.base_url}/surveys"
+        assert kwargs["data"] == {"name": "My Survey"}
+        uploaded = json.loads(kwargs["files"]["file"][1])
+        assert len(uploaded["SurveyElements"]) == 52